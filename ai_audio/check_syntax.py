@@ -7,13 +7,54 @@ code to be displayed as HTML instead of being executed, specifically:
 - Template literals (backticks) that may break string concatenation
 - Dollar brace expressions that should be avoided in single-file HTML apps
 
-Usage: python check_syntax.py [filename]
+Usage: python check_syntax.py [filename ...]
 If no filename provided, defaults to ai_audio.html
+Glob patterns (e.g. "*.html") are expanded, so many files share one run
 """
 
 import re
 import sys
 import os
+import mmap
+import glob
+from collections import Counter
+
+# Patterns work on bytes so they can run straight over the mmap'd file.
+# Template literals and dollar braces are scanned independently: a ${...}
+# may overlap a backtick span, and both are counted, as with two findall()s
+TEMPLATE_LITERAL_RE = re.compile(rb'`[^`]*`')
+DOLLAR_BRACE_RE = re.compile(rb'\$\{[^}]*\}')
+JS_LINE_RE = re.compile(rb'^(?:[ \t]*//|.*(?:<script>|</script>|function)).*$', re.M)
+NEWLINE_RE = re.compile(rb'\n')
+ONCLICK_ATTR = b'onclick="'
+
+def count_unescaped_quotes(content):
+    """Count onclick attributes followed by at least three more quotes.
+
+    Linear str.find scan equivalent to the regex onclick="[^"]*"[^"]*"[^"]*"
+    """
+    found = 0
+    pos = content.find(ONCLICK_ATTR)
+    while pos != -1:
+        quote = pos + len(ONCLICK_ATTR) - 1
+        for _ in range(3):
+            quote = content.find(b'"', quote + 1)
+            if quote == -1:
+                # Later attributes have even fewer quotes after them
+                return found
+        found += 1
+        pos = content.find(ONCLICK_ATTR, quote + 1)
+    return found
+
+def scan_matches(pattern, content, keep=3):
+    """Count pattern matches, keeping the first `keep` of them for previews"""
+    count = 0
+    samples = []
+    for m in pattern.finditer(content):
+        count += 1
+        if len(samples) < keep:
+            samples.append(m.group().decode('utf-8', 'replace'))
+    return count, samples
 
 def check_js_syntax(file_path):
     """Check JavaScript syntax issues in HTML file"""
@@ -23,8 +64,13 @@ def check_js_syntax(file_path):
         return False
     
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        with open(file_path, 'rb') as f:
+            # mmap lets the kernel page the file in as the scan touches it,
+            # with no decoded in-memory copy (empty files cannot be mapped)
+            if os.fstat(f.fileno()).st_size:
+                content = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                content = b''
     except Exception as e:
         print(f"❌ Error reading file: {e}")
         return False
@@ -32,26 +78,25 @@ def check_js_syntax(file_path):
     print(f"🔍 Checking JavaScript syntax in: {file_path}")
     print("-" * 50)
     
-    # Check for template literals (backticks)
-    template_literals = re.findall(r'`[^`]*`', content)
-    
-    # Check for dollar brace expressions
-    dollar_braces = re.findall(r'\$\{[^}]*\}', content)
+    # Keep only the first 3 matches of each kind for previews
+    counts = Counter()
+    counts['tl'], template_literals = scan_matches(TEMPLATE_LITERAL_RE, content)
+    counts['db'], dollar_braces = scan_matches(DOLLAR_BRACE_RE, content)
+    counts['uq'] = count_unescaped_quotes(content)
     
     # Check for common problematic patterns
     problematic_patterns = []
     
     # ES6 template strings in single-file HTML
-    if template_literals:
-        problematic_patterns.append(f"Template literals: {len(template_literals)} found")
+    if counts['tl']:
+        problematic_patterns.append(f"Template literals: {counts['tl']} found")
     
-    if dollar_braces:
-        problematic_patterns.append(f"Dollar brace expressions: {len(dollar_braces)} found")
+    if counts['db']:
+        problematic_patterns.append(f"Dollar brace expressions: {counts['db']} found")
     
     # Check for unescaped quotes in HTML attributes
-    unescaped_quotes = re.findall(r'onclick="[^"]*"[^"]*"[^"]*"', content)
-    if unescaped_quotes:
-        problematic_patterns.append(f"Potentially unescaped quotes: {len(unescaped_quotes)} found")
+    if counts['uq']:
+        problematic_patterns.append(f"Potentially unescaped quotes: {counts['uq']} found")
     
     # Results
     if not problematic_patterns:
@@ -66,40 +111,60 @@ def check_js_syntax(file_path):
         
         if template_literals:
             print("\n📝 Template literals found (showing first 3):")
-            for i, literal in enumerate(template_literals[:3], 1):
+            for i, literal in enumerate(template_literals, 1):
                 preview = literal[:50] + "..." if len(literal) > 50 else literal
                 print(f"   {i}. {preview}")
         
         if dollar_braces:
             print("\n📝 Dollar brace expressions found (showing first 3):")
-            for i, expr in enumerate(dollar_braces[:3], 1):
+            for i, expr in enumerate(dollar_braces, 1):
                 print(f"   {i}. {expr}")
     
     # File statistics
-    js_lines = len([line for line in content.split('\n') if '<script>' in line or '</script>' in line or (line.strip().startswith('//') or 'function' in line)])
-    total_lines = len(content.split('\n'))
+    # Count matches without building a list of them (one entry per line)
+    js_lines = sum(1 for _ in JS_LINE_RE.finditer(content))
+    total_lines = sum(1 for _ in NEWLINE_RE.finditer(content)) + 1
+    file_size = len(content)
+    if isinstance(content, mmap.mmap):
+        content.close()
     
     print(f"\n📊 File Statistics:")
     print(f"   - Total lines: {total_lines}")
-    print(f"   - File size: {len(content):,} characters")
-    print(f"   - JavaScript sections detected")
+    print(f"   - File size: {file_size:,} bytes")
+    print(f"   - JavaScript sections detected: {js_lines} lines")
     
     print(f"\n✅ Syntax check completed for {os.path.basename(file_path)}")
     
     return len(problematic_patterns) == 0
 
-def main():
-    # Get filename from command line argument or use default
-    if len(sys.argv) > 1:
-        filename = sys.argv[1]
-    else:
-        filename = "ai_audio.html"
+def check_many(paths):
+    """Check several HTML files in one process, reusing the compiled patterns"""
+    results = [check_js_syntax(path) for path in paths]
+    
+    if len(results) > 1:
+        print(f"\n📋 Checked {len(results)} files, {results.count(False)} with issues")
     
-    # Check if it's a relative path, make it relative to current directory
-    if not os.path.isabs(filename):
-        filename = os.path.join(os.getcwd(), filename)
+    return all(results)
+
+def main():
+    # Get filenames from command line arguments or use default
+    args = sys.argv[1:] or ["ai_audio.html"]
+    
+    filenames = []
+    for arg in args:
+        # Expand glob patterns the shell left untouched (e.g. on Windows)
+        matches = sorted(glob.glob(arg)) if glob.has_magic(arg) else [arg]
+        for filename in matches:
+            # Check if it's a relative path, make it relative to current directory
+            if not os.path.isabs(filename):
+                filename = os.path.join(os.getcwd(), filename)
+            filenames.append(filename)
+    
+    if not filenames:
+        print(f"❌ Error: No files matched {' '.join(args)}")
+        sys.exit(1)
     
-    success = check_js_syntax(filename)
+    success = check_many(filenames)
     
     if not success:
         sys.exit(1)
@@ -16,10 +16,73 @@ import json
 import click
 import tarfile
 import shutil
+import subprocess
+from contextlib import nullcontext
 from pathlib import Path
-from typing import List, Dict, Any, Set
+from typing import List, Dict, Any, Set, Optional
 from datetime import datetime
-from collections import defaultdict
+from collections import defaultdict, Counter
+from operator import methodcaller
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _dumps_compact(obj: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes, with orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+# Large buffers for archive extraction: the stream mode reads the compressed
+# file in EXTRACT_BUFSIZE chunks and copies members out in COPY_BUFSIZE chunks,
+# instead of tarfile's 10 KiB records and 16 KiB GzipFile reads
+EXTRACT_BUFSIZE = 1 << 20
+COPY_BUFSIZE = 2 << 20
+WRITE_BUFSIZE = 1 << 20
+
+# System tar (and pigz for parallel gunzip) is much faster than tarfile+gzip
+TAR_COMMAND = shutil.which('tar')
+PIGZ_COMMAND = shutil.which('pigz')
+
+
+def _extract_one(archive_file: Path, destination: Path) -> Path:
+    """Extract one .tar.gz package and return the extracted folder path.
+    
+    Kept at module level so it can be pickled into worker processes (used
+    for the tarfile fallback). Uses the system tar when available.
+    """
+    if TAR_COMMAND:
+        if PIGZ_COMMAND:
+            command = [TAR_COMMAND, f'--use-compress-program={PIGZ_COMMAND}', '-xf']
+        else:
+            command = [TAR_COMMAND, '-xzf']
+        command += [str(archive_file), '-C', str(destination)]
+        
+        result = subprocess.run(command, capture_output=True, text=True)
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.strip() or f"tar exited with status {result.returncode}")
+    else:
+        # Sequential "r|gz" stream avoids the seekable GzipFile layer
+        with tarfile.open(archive_file, "r|gz", bufsize=EXTRACT_BUFSIZE,
+                          copybufsize=COPY_BUFSIZE) as tar:
+            tar.extractall(path=destination)
+    
+    # Find the extracted folder
+    package_name = archive_file.stem.replace('.tar', '')
+    return destination / package_name
+
+
+def _file_suffix(filename: str) -> str:
+    """Lower-cased extension, same as Path(filename).suffix.lower() without building a Path."""
+    name = filename[filename.rfind('/') + 1:]
+    dot = name.rfind('.')
+    return name[dot:].lower() if 0 < dot < len(name) - 1 else ''
 
 
 class DocumentJoiner:
@@ -31,12 +94,19 @@ class DocumentJoiner:
         'ai-docu-universal-metadata.json',
         'ai-docu-metadata.json'
     ]
+    METADATA_NAMES = frozenset(SUPPORTED_METADATA_PATTERNS)
     
-    def __init__(self, input_folder: Path, output_folder: Path):
-        self.input_folder = Path(input_folder)
-        self.output_folder = Path(output_folder)
+    def __init__(self, input_folder: Path, output_folder: Path, quiet: bool = False,
+                 pretty: bool = False):
+        # Click already hands over Path objects; only wrap plain strings
+        self.input_folder = input_folder if isinstance(input_folder, Path) else Path(input_folder)
+        self.output_folder = output_folder if isinstance(output_folder, Path) else Path(output_folder)
+        self.quiet = quiet
+        self.pretty = pretty
         self.processed_files = set()
         self.merged_data = defaultdict(dict)
+        self._pkg_doc_counts: Dict[Path, int] = {}
+        self._metadata_files_cache: Dict[Path, List[Path]] = {}
         
     def extract_compressed_packages(self) -> List[Path]:
         """Extract any compressed packages in the input folder."""
@@ -48,24 +118,27 @@ class DocumentJoiner:
         if archive_files:
             click.echo(f"🗜️  Found {len(archive_files)} compressed packages to extract")
             
-            for archive_file in archive_files:
-                click.echo(f"   Extracting {archive_file.name}...")
+            # In-process tarfile decompression is CPU-bound and needs processes; with
+            # the system tar each worker only waits on a subprocess, so threads do
+            max_workers = min(len(archive_files), os.cpu_count() or 1)
+            pool_class = ThreadPoolExecutor if TAR_COMMAND else ProcessPoolExecutor
+            with pool_class(max_workers=max_workers) as executor:
+                futures = {}
+                for archive_file in archive_files:
+                    click.echo(f"   Extracting {archive_file.name}...")
+                    futures[executor.submit(_extract_one, archive_file, self.input_folder)] = archive_file
                 
-                try:
-                    with tarfile.open(archive_file, "r:gz") as tar:
-                        # Extract to input folder
-                        tar.extractall(path=self.input_folder)
+                for future in as_completed(futures):
+                    archive_file = futures[future]
+                    try:
+                        extracted_path = future.result()
                         
-                    # Find the extracted folder
-                    package_name = archive_file.stem.replace('.tar', '')
-                    extracted_path = self.input_folder / package_name
-                    
-                    if extracted_path.exists():
-                        extracted_paths.append(extracted_path)
-                        click.echo(f"   ✓ Extracted to {package_name}/")
-                    
-                except Exception as e:
-                    click.echo(f"   ❌ Error extracting {archive_file.name}: {e}")
+                        if extracted_path.exists():
+                            extracted_paths.append(extracted_path)
+                            click.echo(f"   ✓ Extracted {archive_file.name} to {extracted_path.name}/")
+                        
+                    except Exception as e:
+                        click.echo(f"   ❌ Error extracting {archive_file.name}: {e}")
                     
         return extracted_paths
     
@@ -73,40 +146,53 @@ class DocumentJoiner:
         """Find all package directories (both extracted and uncompressed)."""
         package_dirs = []
         
-        # Look for directories that match package naming pattern
-        for item in self.input_folder.iterdir():
-            if item.is_dir() and (
-                item.name.startswith('docu-package-') or 
-                'package' in item.name.lower() or
-                self.has_metadata_files(item)
-            ):
-                package_dirs.append(item)
+        # Look for directories that match package naming pattern; the cheap
+        # name tests run first so only unmatched folders get listed.
+        # DirEntry.is_dir() is answered from the directory listing, no stat()
+        with os.scandir(self.input_folder) as entries:
+            for entry in entries:
+                if entry.is_dir() and (
+                    entry.name.startswith('docu-package-') or 
+                    'package' in entry.name.lower() or
+                    self.has_metadata_files(Path(entry.path))
+                ):
+                    package_dirs.append(Path(entry.path))
         
         return sorted(package_dirs)
     
     def has_metadata_files(self, directory: Path) -> bool:
         """Check if directory contains metadata files."""
-        for pattern in self.SUPPORTED_METADATA_PATTERNS:
-            if (directory / pattern).exists():
-                return True
-        return False
+        try:
+            # Single listing, cached for the later find_metadata_files() calls
+            return bool(self.find_metadata_files(directory))
+        except OSError:
+            return False
     
     def find_metadata_files(self, package_dir: Path) -> List[Path]:
         """Find all metadata files in a package directory."""
-        metadata_files = []
-        
-        for pattern in self.SUPPORTED_METADATA_PATTERNS:
-            metadata_file = package_dir / pattern
-            if metadata_file.exists():
-                metadata_files.append(metadata_file)
-                
+        cached = self._metadata_files_cache.get(package_dir)
+        if cached is not None:
+            return cached
+        
+        # One directory listing instead of an exists() probe per pattern
+        present = self.METADATA_NAMES.intersection(os.listdir(package_dir))
+        metadata_files = [
+            package_dir / pattern
+            for pattern in self.SUPPORTED_METADATA_PATTERNS
+            if pattern in present
+        ]
+        
+        self._metadata_files_cache[package_dir] = metadata_files
         return metadata_files
     
     def load_metadata_file(self, metadata_file: Path) -> Dict[str, Any]:
         """Load and validate a metadata JSON file."""
         try:
-            with open(metadata_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(metadata_file, 'rb') as f:
+                raw = f.read()
+            
+            # orjson parses straight from bytes, skipping the text decode
+            data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
                 
             # Validate structure
             if not isinstance(data, dict):
@@ -122,103 +208,120 @@ class DocumentJoiner:
         except Exception as e:
             raise ValueError(f"Error reading file: {e}")
     
-    def merge_metadata(self, all_metadata: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def merge_metadata(self, all_metadata: List[Dict[str, Any]],
+                       run_timestamp: Optional[datetime] = None) -> Dict[str, Any]:
         """Merge multiple metadata dictionaries into one."""
         if not all_metadata:
             return {}
+        
+        run_timestamp = run_timestamp or datetime.now()
             
-        # Start with the first metadata as base
+        # Later packages win on duplicate filenames, as with repeated update()
+        dicts = [m['metadata'] for m in all_metadata if 'metadata' in m]
+        models = {
+            m['export_info']['ai_model']
+            for m in all_metadata
+            if 'export_info' in m and 'ai_model' in m['export_info']
+        }
+        
+        merged_docs = {k: v for d in dicts for k, v in d.items()}
+        
         merged = {
-            'metadata': {},
+            'metadata': merged_docs,
             'export_info': {
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': run_timestamp.isoformat(),
                 'source': 'AI Docu App - Document Joiner',
                 'merged_packages': len(all_metadata),
-                'total_documents': 0,
-                'ai_models_used': set()
+                'total_documents': len(merged_docs),
+                'ai_models_used': list(models)
             }
         }
         
-        # Merge all document metadata
-        for metadata_dict in all_metadata:
-            if 'metadata' in metadata_dict:
-                merged['metadata'].update(metadata_dict['metadata'])
-                
-            # Collect export info
-            if 'export_info' in metadata_dict:
-                export_info = metadata_dict['export_info']
-                if 'ai_model' in export_info:
-                    merged['export_info']['ai_models_used'].add(export_info['ai_model'])
-        
-        # Convert set to list for JSON serialization
-        merged['export_info']['ai_models_used'] = list(merged['export_info']['ai_models_used'])
-        merged['export_info']['total_documents'] = len(merged['metadata'])
-        
         return merged
     
-    def create_summary_report(self, merged_data: Dict[str, Any], package_dirs: List[Path]) -> str:
+    def write_merged_metadata(self, merged_data: Dict[str, Any], output_file: Path):
+        """Write the merged metadata JSON, compact unless pretty output was requested."""
+        if self.pretty:
+            if ORJSON_AVAILABLE:
+                with open(output_file, 'wb', buffering=WRITE_BUFSIZE) as f:
+                    f.write(orjson.dumps(merged_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            else:
+                with open(output_file, 'w', encoding='utf-8', buffering=WRITE_BUFSIZE) as f:
+                    json.dump(merged_data, f, indent=2, ensure_ascii=False)
+            return
+        
+        # Compact output is streamed one document at a time, so only a single
+        # serialized entry is held in memory instead of the whole file
+        with open(output_file, 'wb', buffering=WRITE_BUFSIZE) as f:
+            f.write(b'{')
+            for i, (key, value) in enumerate(merged_data.items()):
+                if i:
+                    f.write(b',')
+                f.write(_dumps_compact(key) + b':')
+                
+                if key != 'metadata':
+                    f.write(_dumps_compact(value))
+                    continue
+                
+                f.write(b'{')
+                for j, (filename, doc_data) in enumerate(value.items()):
+                    if j:
+                        f.write(b',')
+                    f.write(_dumps_compact(filename) + b':' + _dumps_compact(doc_data))
+                f.write(b'}')
+            f.write(b'}')
+    
+    def create_summary_report(self, merged_data: Dict[str, Any], package_dirs: List[Path],
+                              run_timestamp: Optional[datetime] = None) -> str:
         """Create a summary report of the joining process."""
-        report = f"""# AI Docu App - Document Analysis Summary Report
+        run_timestamp = run_timestamp or datetime.now()
+        parts = [f"""# AI Docu App - Document Analysis Summary Report
 
 ## 📊 Merge Summary
 
-**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}  
+**Generated:** {run_timestamp.strftime('%Y-%m-%d %H:%M:%S')}  
 **Source Packages:** {len(package_dirs)}  
 **Total Documents:** {len(merged_data.get('metadata', {}))}  
 **AI Models Used:** {', '.join(merged_data['export_info']['ai_models_used'])}
 
 ## 📦 Source Packages
 
-"""
+"""]
         
         for i, package_dir in enumerate(package_dirs, 1):
             metadata_files = self.find_metadata_files(package_dir)
-            doc_count = 0
             
-            # Count documents from first metadata file
-            if metadata_files:
-                try:
-                    with open(metadata_files[0], 'r') as f:
-                        data = json.load(f)
-                        doc_count = len(data.get('metadata', {}))
-                except:
-                    pass
+            # Document count of the first metadata file, recorded during join()
+            doc_count = self._pkg_doc_counts.get(package_dir, 0)
                     
-            report += f"{i}. **{package_dir.name}**\n"
-            report += f"   - Documents: {doc_count}\n"
-            report += f"   - Metadata files: {len(metadata_files)}\n"
+            parts.append(f"{i}. **{package_dir.name}**\n")
+            parts.append(f"   - Documents: {doc_count}\n")
+            parts.append(f"   - Metadata files: {len(metadata_files)}\n")
             if metadata_files:
-                report += f"   - AI models: {[f.name.replace('ai-docu-', '').replace('-metadata.json', '') for f in metadata_files]}\n"
-            report += "\n"
+                model_names = [f.name.replace('ai-docu-', '').replace('-metadata.json', '') for f in metadata_files]
+                parts.append(f"   - AI models: {model_names}\n")
+            parts.append("\n")
         
         # Document analysis summary
         if merged_data.get('metadata'):
-            report += "## 📄 Document Analysis Overview\n\n"
-            
-            # Count by file type
-            file_types = defaultdict(int)
-            has_summaries = 0
-            has_keywords = 0
+            parts.append("## 📄 Document Analysis Overview\n\n")
             
-            for filename, doc_data in merged_data['metadata'].items():
-                # Extract file extension
-                ext = Path(filename).suffix.lower()
-                file_types[ext] += 1
-                
-                if doc_data.get('summary'):
-                    has_summaries += 1
-                if doc_data.get('keywords'):
-                    has_keywords += 1
+            # Count by file type; map/sum keep the per-document loops in C
+            documents = merged_data['metadata']
+            file_types = Counter(map(_file_suffix, documents))
+            has_summaries = sum(map(bool, map(methodcaller('get', 'summary'), documents.values())))
+            has_keywords = sum(map(bool, map(methodcaller('get', 'keywords'), documents.values())))
             
-            report += "### File Types\n"
+            parts.append("### File Types\n")
             for ext, count in sorted(file_types.items()):
-                report += f"- **{ext or 'no extension'}**: {count} files\n"
+                parts.append(f"- **{ext or 'no extension'}**: {count} files\n")
             
-            report += f"\n### Analysis Coverage\n"
-            report += f"- Documents with summaries: {has_summaries}/{len(merged_data['metadata'])} ({has_summaries/len(merged_data['metadata'])*100:.1f}%)\n"
-            report += f"- Documents with keywords: {has_keywords}/{len(merged_data['metadata'])} ({has_keywords/len(merged_data['metadata'])*100:.1f}%)\n"
+            total = len(documents)
+            parts.append(f"\n### Analysis Coverage\n")
+            parts.append(f"- Documents with summaries: {has_summaries}/{total} ({has_summaries/total*100:.1f}%)\n")
+            parts.append(f"- Documents with keywords: {has_keywords}/{total} ({has_keywords/total*100:.1f}%)\n")
         
-        report += f"""
+        parts.append(f"""
 ## 🚀 Next Steps
 
 1. **Review Results**: Open the merged metadata JSON file to review all analysis
@@ -235,14 +338,17 @@ class DocumentJoiner:
 ---
 
 *Report generated by AI Docu App Document Joiner v1.0.0*
-"""
+""")
         
-        return report
+        return ''.join(parts)
     
     def join(self) -> Dict[str, Any]:
         """Main method to join all work packages."""
         click.echo(f"🔍 Analyzing input folder: {self.input_folder}")
         
+        # One timestamp shared by the merged metadata, report and manifest
+        run_timestamp = datetime.now()
+        
         # Extract any compressed packages first
         extracted_paths = self.extract_compressed_packages()
         if extracted_paths:
@@ -258,54 +364,64 @@ class DocumentJoiner:
         # Collect all metadata files
         all_metadata = []
         total_documents = 0
+        load_errors = []
+        package_files = [(package_dir, self.find_metadata_files(package_dir)) for package_dir in package_dirs]
         
-        for package_dir in package_dirs:
-            click.echo(f"\n📄 Processing package: {package_dir.name}")
-            
-            metadata_files = self.find_metadata_files(package_dir)
+        for package_dir, metadata_files in package_files:
             if not metadata_files:
-                click.echo(f"   ⚠️  No metadata files found, skipping")
-                continue
-                
-            click.echo(f"   Found {len(metadata_files)} metadata files")
+                click.echo(f"   ⚠️  No metadata files found in {package_dir.name}, skipping")
+        
+        # Parse every file concurrently, but consume the results in discovery
+        # order so later packages still win on duplicate document names
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            entries = [
+                (package_dir, metadata_file, executor.submit(self.load_metadata_file, metadata_file))
+                for package_dir, metadata_files in package_files
+                for metadata_file in metadata_files
+            ]
             
-            # Process each metadata file
-            for metadata_file in metadata_files:
-                try:
-                    click.echo(f"   Loading {metadata_file.name}...")
-                    metadata_dict = self.load_metadata_file(metadata_file)
+            # One progress bar instead of several echo lines per file
+            if self.quiet:
+                progress = nullcontext(entries)
+            else:
+                progress = click.progressbar(entries, label="📄 Loading metadata files")
+            
+            with progress as bar:
+                for package_dir, metadata_file, future in bar:
+                    try:
+                        metadata_dict = future.result()
+                    except Exception as e:
+                        load_errors.append(f"❌ Error loading {package_dir.name}/{metadata_file.name}: {e}")
+                        continue
                     
                     doc_count = len(metadata_dict.get('metadata', {}))
                     all_metadata.append(metadata_dict)
                     total_documents += doc_count
-                    
-                    click.echo(f"   ✓ Loaded {doc_count} documents")
-                    
-                except Exception as e:
-                    click.echo(f"   ❌ Error loading {metadata_file.name}: {e}")
-                    continue
+                    self._pkg_doc_counts.setdefault(package_dir, doc_count)
+        
+        for message in load_errors:
+            click.echo(f"   {message}", err=True)
         
         if not all_metadata:
             raise click.ClickException("No valid metadata files found to merge")
         
-        click.echo(f"\n🔄 Merging {len(all_metadata)} metadata files...")
-        click.echo(f"📊 Total documents to merge: {total_documents}")
+        click.echo(f"\n🔄 Merging {total_documents} documents from {len(all_metadata)} metadata files...")
         
         # Merge all metadata
-        merged_data = self.merge_metadata(all_metadata)
+        merged_data = self.merge_metadata(all_metadata, run_timestamp)
         
         # Create output directory
         self.output_folder.mkdir(parents=True, exist_ok=True)
         
         # Save merged metadata
         output_file = self.output_folder / "merged-ai-docu-metadata.json"
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(merged_data, f, indent=2, ensure_ascii=False)
+        self.write_merged_metadata(merged_data, output_file)
         
         click.echo(f"✓ Saved merged metadata: {output_file}")
         
         # Create summary report
-        summary_report = self.create_summary_report(merged_data, package_dirs)
+        summary_report = self.create_summary_report(merged_data, package_dirs, run_timestamp)
         report_file = self.output_folder / "join-summary-report.md"
         with open(report_file, 'w', encoding='utf-8') as f:
             f.write(summary_report)
@@ -315,7 +431,7 @@ class DocumentJoiner:
         # Create package manifest
         manifest = {
             "join_info": {
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": run_timestamp.isoformat(),
                 "source_packages": [str(p) for p in package_dirs],
                 "total_metadata_files": len(all_metadata),
                 "total_documents": len(merged_data['metadata']),
@@ -350,8 +466,16 @@ class DocumentJoiner:
               is_flag=True,
               default=False,
               help='Clean up extracted package folders after processing')
+@click.option('--quiet', '-q',
+              is_flag=True,
+              default=False,
+              help='Hide the progress bar while loading metadata files')
+@click.option('--pretty', '-p',
+              is_flag=True,
+              default=False,
+              help='Indent the merged metadata JSON (default: compact)')
 @click.version_option(version='1.0.0', prog_name='AI Docu App Document Joiner')
-def main(input: Path, output: Path, clean_extracted: bool):
+def main(input: Path, output: Path, clean_extracted: bool, quiet: bool, pretty: bool):
     """
     📄 AI Docu App - Document Joiner Tool
     
@@ -378,7 +502,7 @@ def main(input: Path, output: Path, clean_extracted: bool):
         click.echo("=" * 42)
         
         # Initialize joiner
-        joiner = DocumentJoiner(input, output)
+        joiner = DocumentJoiner(input, output, quiet=quiet, pretty=pretty)
         
         # Perform the join
         merged_data = joiner.join()
@@ -396,10 +520,11 @@ def main(input: Path, output: Path, clean_extracted: bool):
         if clean_extracted:
             click.echo(f"4. Cleanup: Removing extracted package directories...")
             # Clean up extracted directories
-            for item in input.iterdir():
-                if item.is_dir() and item.name.startswith('docu-package-'):
-                    shutil.rmtree(item)
-                    click.echo(f"   ✓ Removed {item.name}")
+            with os.scandir(input) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False) and entry.name.startswith('docu-package-'):
+                        shutil.rmtree(entry.path)
+                        click.echo(f"   ✓ Removed {entry.name}")
         
     except Exception as e:
         click.echo(f"❌ Error: {e}", err=True)
@@ -12,137 +12,137 @@ Author: AI Docu App Team
 """
 
 import os
+import sys
 import shutil
+import gzip
+import io
+import subprocess
 import math
+import string
 import click
 import tarfile
 from pathlib import Path
-from typing import List, Tuple
+from typing import Any, Dict, Iterator, List, Tuple, Optional
 import json
+import errno
+import threading
+from contextlib import contextmanager, nullcontext
+from functools import cached_property, partial
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
-class DocumentSplitter:
-    """Handles splitting document collections into collaborative work packages."""
-    
-    SUPPORTED_EXTENSIONS = {'.txt', '.pdf', '.docx', '.rtf', '.md'}
-    HTML_FILES = ['ai_docu.html']
+try:
+    import libarchive
+    LIBARCHIVE_AVAILABLE = True
+except ImportError:
+    LIBARCHIVE_AVAILABLE = False
+
+try:
+    import zstandard
+    ZSTANDARD_AVAILABLE = True
+except ImportError:
+    ZSTANDARD_AVAILABLE = False
+
+def _dumps_pretty(obj: Any) -> bytes:
+    """Serialize to 2-space indented UTF-8 JSON bytes, with orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+# pigz compresses on all cores; without it gzip runs in-process on one
+PIGZ_COMMAND = shutil.which('pigz')
+DEFAULT_COMPRESS_LEVEL = 6
+
+SENDFILE_CHUNK = 1 << 30
+SENDFILE_FALLBACK_ERRORS = {errno.EINVAL, errno.ENOSYS, errno.ENOTSUP, errno.EXDEV}
+
+
+def _copy_fd_range(in_fd: int, out_fd: int) -> bool:
+    """Copy with os.copy_file_range; return False if the filesystem can't.
     
-    def __init__(self, source_folder: Path, output_folder: Path, num_splits: int):
-        self.source_folder = Path(source_folder)
-        self.output_folder = Path(output_folder)
-        self.num_splits = num_splits
-        self.project_root = self.find_project_root()
-        
-    def find_project_root(self) -> Path:
-        """Find the project root containing HTML files."""
-        current = Path(__file__).parent
-        while current.parent != current:
-            if all((current / html).exists() for html in self.HTML_FILES):
-                return current
-            current = current.parent
-        raise FileNotFoundError("Could not find project root with HTML files")
+    On copy-on-write filesystems (btrfs, XFS with reflink) the kernel
+    turns this into a reflink, so no file data is copied at all.
+    """
+    try:
+        while os.copy_file_range(in_fd, out_fd, SENDFILE_CHUNK):
+            pass
+    except OSError as e:
+        if e.errno not in SENDFILE_FALLBACK_ERRORS:
+            raise
+        return False
+    return True
+
+
+def _fast_copy(src: Path, dst: Path, copy_stat: bool = True):
+    """Copy a file like shutil.copy2, moving the data in-kernel.
     
-    def get_document_files(self) -> List[Path]:
-        """Get all supported document files from source folder."""
-        document_files = []
-        for ext in self.SUPPORTED_EXTENSIONS:
-            document_files.extend(self.source_folder.glob(f"*{ext}"))
-            document_files.extend(self.source_folder.glob(f"*{ext.upper()}"))
-        return sorted(document_files)
+    Uses os.copy_file_range where available (reflinking on CoW filesystems),
+    then os.sendfile. With copy_stat=False only the data is copied, like
+    shutil.copyfile.
+    """
+    # Only Linux sendfile writes to regular files (macOS/BSD need a socket)
+    if not (sys.platform.startswith('linux') and hasattr(os, 'sendfile')):
+        if copy_stat:
+            shutil.copy2(src, dst)
+        else:
+            shutil.copyfile(src, dst)
+        return
     
-    def split_documents(self, document_files: List[Path]) -> List[List[Path]]:
-        """Split document files into roughly equal chunks."""
-        if not document_files:
-            raise ValueError("No document files found in source folder")
-            
-        chunk_size = math.ceil(len(document_files) / self.num_splits)
-        chunks = []
-        
-        for i in range(self.num_splits):
-            start_idx = i * chunk_size
-            end_idx = min((i + 1) * chunk_size, len(document_files))
-            chunk = document_files[start_idx:end_idx]
-            if chunk:  # Only add non-empty chunks
-                chunks.append(chunk)
-                
-        return chunks
+    try:
+        in_fd = os.open(src, os.O_RDONLY)
+        try:
+            out_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+            try:
+                # Both calls advance the file offsets, so sendfile picks up
+                # wherever copy_file_range stopped
+                if not (hasattr(os, 'copy_file_range') and _copy_fd_range(in_fd, out_fd)):
+                    while os.sendfile(out_fd, in_fd, None, SENDFILE_CHUNK):
+                        pass
+            finally:
+                os.close(out_fd)
+        finally:
+            os.close(in_fd)
+    except OSError as e:
+        # Some filesystems cannot do in-kernel file-to-file copies
+        if e.errno not in SENDFILE_FALLBACK_ERRORS:
+            raise
+        shutil.copyfile(src, dst)
     
-    def create_work_package(self, chunk_id: int, document_chunk: List[Path]) -> Path:
-        """Create a complete work package with HTML files and documents."""
-        package_name = f"docu-package-{chunk_id:03d}"
-        package_path = self.output_folder / package_name
-        
-        # Create package directory
-        package_path.mkdir(parents=True, exist_ok=True)
-        
-        # Copy HTML files
-        for html_file in self.HTML_FILES:
-            src_path = self.project_root / html_file
-            dst_path = package_path / html_file
-            shutil.copy2(src_path, dst_path)
-            click.echo(f"  ✓ Copied {html_file}")
-        
-        # Copy docs folder if it exists
-        docs_src = self.project_root / "docs"
-        if docs_src.exists():
-            docs_dst = package_path / "docs"
-            shutil.copytree(docs_src, docs_dst, dirs_exist_ok=True)
-            click.echo(f"  ✓ Copied docs folder")
-        
-        # Create documents subfolder and copy documents
-        documents_path = package_path / "documents"
-        documents_path.mkdir(exist_ok=True)
-        
-        for doc_file in document_chunk:
-            dst_path = documents_path / doc_file.name
-            shutil.copy2(doc_file, dst_path)
-            
-        click.echo(f"  ✓ Copied {len(document_chunk)} documents")
-        
-        # Create package manifest
-        self.create_manifest(package_path, chunk_id, document_chunk)
-        
-        # Create README for team members
-        self.create_package_readme(package_path, chunk_id, document_chunk)
-        
-        return package_path
+    if copy_stat:
+        shutil.copystat(src, dst)
+
+
+def _link_or_copy(src, dst):
+    """Hardlink a read-only shared file into a package, copying across filesystems."""
+    # Never write through an existing link: that would modify the source file
+    if os.path.lexists(dst):
+        os.unlink(dst)
+    try:
+        os.link(src, dst)
+    except OSError:
+        _fast_copy(src, dst)
+
+
+class DocumentSplitter:
+    """Handles splitting document collections into collaborative work packages."""
     
-    def create_manifest(self, package_path: Path, chunk_id: int, document_chunk: List[Path]):
-        """Create a manifest file describing the package contents."""
-        manifest = {
-            "package_info": {
-                "id": chunk_id,
-                "name": f"docu-package-{chunk_id:03d}",
-                "created": datetime.now().isoformat(),
-                "total_packages": self.num_splits,
-                "document_count": len(document_chunk)
-            },
-            "html_files": self.HTML_FILES,
-            "documents": [doc.name for doc in document_chunk],
-            "instructions": {
-                "1": "Open ai_docu.html in your browser",
-                "2": "Load documents from the 'documents' folder",
-                "3": "Select your preferred AI model",
-                "4": "Click 'AI Analyze' to process your assigned documents",
-                "5": "Export metadata when analysis is complete",
-                "6": "Share the exported JSON file back to the project lead"
-            }
-        }
-        
-        manifest_path = package_path / "package-manifest.json"
-        with open(manifest_path, 'w', encoding='utf-8') as f:
-            json.dump(manifest, f, indent=2, ensure_ascii=False)
-        
-        click.echo(f"  ✓ Created package manifest")
+    SUPPORTED_EXTENSIONS = {'.txt', '.pdf', '.docx', '.rtf', '.md'}
+    HTML_FILES = ['ai_docu.html']
     
-    def create_package_readme(self, package_path: Path, chunk_id: int, document_chunk: List[Path]):
-        """Create a README.md file with instructions for team members."""
-        readme_content = f"""# AI Docu Analysis Work Package
+    # Team member instructions, filled in per package by build_readme
+    README_TEMPLATE = string.Template("""# AI Docu Analysis Work Package
 
-📦 **Package:** docu-package-{chunk_id:03d}  
-📄 **Documents to analyze:** {len(document_chunk)}  
-📅 **Created:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+📦 **Package:** docu-package-${chunk_id_str}  
+📄 **Documents to analyze:** ${doc_count}  
+📅 **Created:** ${created}
 
 ## 🚀 Quick Start
 
@@ -153,7 +153,7 @@ Open the HTML file in your web browser:
 ### 2. Load Documents
 - Click **"📁 Select Documents"** and choose files from the `documents/` folder
 - Or click **"📂 Select Folder"** and select the entire `documents/` folder
-- You should see {len(document_chunk)} documents loaded
+- You should see ${doc_count} documents loaded
 
 ### 3. Choose AI Model and Analyze
 - Select your preferred AI model from the dropdown:
@@ -174,7 +174,7 @@ Open the HTML file in your web browser:
   ```bash
   # Easy way:
   cd ..
-  tar -czf docu-package-{chunk_id:03d}-completed.tar.gz docu-package-{chunk_id:03d}/
+  tar -czf docu-package-${chunk_id_str}-completed.tar.gz docu-package-${chunk_id_str}/
   ```
 - **Send the compressed file** back to your team lead
 - Team lead will merge all results using the join tool
@@ -190,11 +190,11 @@ Open the HTML file in your web browser:
 ## 🔍 File Structure
 
 ```
-docu-package-{chunk_id:03d}/
+docu-package-${chunk_id_str}/
 ├── README.md                              # This file
 ├── ai_docu.html                           # AI Docu App
 ├── docs/                                  # Documentation assets  
-├── documents/                             # Your {len(document_chunk)} documents to analyze
+├── documents/                             # Your ${doc_count} documents to analyze
 ├── package-manifest.json                 # Package info
 └── [exported-metadata].json              # Your analysis results (after export)
 ```
@@ -214,18 +214,237 @@ If you run into issues:
 4. Contact your team lead for help
 
 **Happy document analyzing! 📄🚀**
-"""
+""")
+    
+    def __init__(self, source_folder: Path, output_folder: Path, num_splits: int,
+                 use_zstd: bool = False, compress_level: int = DEFAULT_COMPRESS_LEVEL,
+                 verbose: bool = False, archive_only: bool = False):
+        self.source_folder = source_folder if isinstance(source_folder, Path) else Path(source_folder)
+        self.output_folder = output_folder if isinstance(output_folder, Path) else Path(output_folder)
+        self.num_splits = num_splits
+        self.use_zstd = use_zstd
+        self.compress_level = compress_level
+        self.verbose = verbose
+        self.archive_only = archive_only
+        self._thread_state = threading.local()
+        self.package_counts: Dict[Path, int] = {}
+        self._set_run_timestamp()
+        
+    @cached_property
+    def project_root(self) -> Path:
+        """Project root containing the HTML files, located on first use."""
+        return self.find_project_root()
+    
+    def find_project_root(self) -> Path:
+        """Find the project root containing HTML files."""
+        html_names = tuple(self.HTML_FILES)
+        current = os.path.dirname(__file__)
+        parent = os.path.dirname(current)
+        while parent != current:
+            if all(os.path.isfile(os.path.join(current, html)) for html in html_names):
+                return Path(current)
+            current, parent = parent, os.path.dirname(parent)
+        raise FileNotFoundError("Could not find project root with HTML files")
+    
+    def iter_document_files(self) -> Iterator[str]:
+        """Yield paths of supported document files in the source folder, unordered."""
+        # One directory pass; lowercasing the name covers both .ext and .EXT
+        exts = tuple(self.SUPPORTED_EXTENSIONS)
+        with os.scandir(self.source_folder) as it:
+            for entry in it:
+                if entry.is_file(follow_symlinks=False) and entry.name.lower().endswith(exts):
+                    yield entry.path
+    
+    def get_document_files(self) -> List[Path]:
+        """Get all supported document files from source folder."""
+        # Sort the plain strings (same order as Paths in one folder) and only
+        # build Path objects once, in final order
+        return [Path(path) for path in sorted(self.iter_document_files())]
+    
+    def split_documents(self, document_files: List[Path]) -> List[List[Path]]:
+        """Split document files into roughly equal chunks."""
+        if not document_files:
+            raise ValueError("No document files found in source folder")
+            
+        chunk_size = math.ceil(len(document_files) / self.num_splits)
+        files = iter(document_files)
+        chunks = []
+        
+        for _ in range(self.num_splits):
+            chunk = list(islice(files, chunk_size))
+            if not chunk:  # Remaining splits would be empty
+                break
+            chunks.append(chunk)
+                
+        return chunks
+    
+    def stage_prototype(self) -> Path:
+        """Copy the shared HTML files and docs/ once into the output folder."""
+        proto = self.output_folder / ".proto"
+        shutil.rmtree(proto, ignore_errors=True)
+        proto.mkdir(parents=True)
+        
+        for html_file in self.HTML_FILES:
+            _fast_copy(self.project_root / html_file, proto / html_file)
+        
+        docs_src = self.project_root / "docs"
+        if docs_src.exists():
+            shutil.copytree(docs_src, proto / "docs",
+                            copy_function=partial(_fast_copy, copy_stat=False))
+        
+        return proto
+    
+    def create_work_package(self, chunk_id: int, document_chunk: List[Path], proto: Path) -> Path:
+        """Create a complete work package with HTML files and documents.
+        
+        Shared files are hardlinked from the staged prototype (see stage_prototype).
+        """
+        package_name = f"docu-package-{chunk_id:03d}"
+        package_path = self.output_folder / package_name
+        
+        # Create package directory
+        package_path.mkdir(parents=True, exist_ok=True)
+        
+        # Copy HTML files (plain string paths; no Path objects in the loops)
+        proto_str = os.fspath(proto)
+        package_path_str = os.fspath(package_path)
+        for html_file in self.HTML_FILES:
+            src_path = os.path.join(proto_str, html_file)
+            dst_path = os.path.join(package_path_str, html_file)
+            _link_or_copy(src_path, dst_path)
+            self._detail(f"  ✓ Copied {html_file}")
+        
+        # Copy docs folder if it exists
+        docs_src = proto / "docs"
+        if docs_src.exists():
+            docs_dst = package_path / "docs"
+            shutil.copytree(docs_src, docs_dst, dirs_exist_ok=True,
+                            copy_function=_link_or_copy)
+            self._detail(f"  ✓ Copied docs folder")
+        
+        # Create documents subfolder and copy documents
+        documents_path = package_path / "documents"
+        documents_path.mkdir(exist_ok=True)
+        
+        documents_path_str = os.fspath(documents_path)
+        for doc_file in document_chunk:
+            dst_path = os.path.join(documents_path_str, doc_file.name)
+            # Packages are throwaway handoffs, so skip copying mtime/mode/xattrs
+            _fast_copy(doc_file, dst_path, copy_stat=False)
+            
+        self._detail(f"  ✓ Copied {len(document_chunk)} documents")
+        
+        # Create package manifest
+        self.create_manifest(package_path, chunk_id, document_chunk)
+        
+        # Create README for team members
+        self.create_package_readme(package_path, chunk_id, document_chunk)
+        
+        return package_path
+    
+    def create_package_archive(self, chunk_id: int, document_chunk: List[Path]) -> Path:
+        """Write a work package straight into a compressed archive.
+        
+        Same contents as create_work_package + compress_package, but files are
+        streamed from their sources without staging a package folder on disk.
+        """
+        package_name = f"docu-package-{chunk_id:03d}"
+        archive_path = self.output_folder / f"{package_name}{self.archive_suffix}"
+        
+        with self._open_tar_stream(archive_path) as tar:
+            tar.addfile(self._tar_member(package_name, directory=True))
+            
+            for html_file in self.HTML_FILES:
+                tar.add(self.project_root / html_file, arcname=f"{package_name}/{html_file}")
+                self._detail(f"  ✓ Added {html_file}")
+            
+            docs_src = self.project_root / "docs"
+            if docs_src.exists():
+                tar.add(docs_src, arcname=f"{package_name}/docs")
+                self._detail(f"  ✓ Added docs folder")
+            
+            tar.addfile(self._tar_member(f"{package_name}/documents", directory=True))
+            for doc_file in document_chunk:
+                tar.add(doc_file, arcname=f"{package_name}/documents/{doc_file.name}")
+            self._detail(f"  ✓ Added {len(document_chunk)} documents")
+            
+            # Generated files go in from memory
+            for name, data in (
+                ("package-manifest.json", _dumps_pretty(self.build_manifest(chunk_id, document_chunk))),
+                ("README.md", self.build_readme(chunk_id, document_chunk).encode('utf-8')),
+            ):
+                tar.addfile(self._tar_member(f"{package_name}/{name}", size=len(data)), io.BytesIO(data))
+            self._detail(f"  ✓ Added package manifest and README.md")
+        
+        self._detail(f"  ✓ Created {archive_path.name}")
+        return archive_path
+    
+    def _tar_member(self, name: str, size: int = 0, directory: bool = False) -> tarfile.TarInfo:
+        """TarInfo for a generated archive member."""
+        info = tarfile.TarInfo(name)
+        info.mtime = self._run_timestamp.timestamp()
+        if directory:
+            info.type = tarfile.DIRTYPE
+            info.mode = 0o755
+        else:
+            info.size = size
+            info.mode = 0o644
+        return info
+    
+    def build_manifest(self, chunk_id: int, document_chunk: List[Path]) -> Dict[str, Any]:
+        """Build the manifest describing the package contents."""
+        return {
+            "package_info": {
+                "id": chunk_id,
+                "name": f"docu-package-{chunk_id:03d}",
+                "created": self._iso_ts,
+                "total_packages": self.num_splits,
+                "document_count": len(document_chunk)
+            },
+            "html_files": self.HTML_FILES,
+            "documents": [doc.name for doc in document_chunk],
+            "instructions": {
+                "1": "Open ai_docu.html in your browser",
+                "2": "Load documents from the 'documents' folder",
+                "3": "Select your preferred AI model",
+                "4": "Click 'AI Analyze' to process your assigned documents",
+                "5": "Export metadata when analysis is complete",
+                "6": "Share the exported JSON file back to the project lead"
+            }
+        }
+    
+    def create_manifest(self, package_path: Path, chunk_id: int, document_chunk: List[Path]):
+        """Create a manifest file describing the package contents."""
+        manifest_path = package_path / "package-manifest.json"
+        manifest_path.write_bytes(_dumps_pretty(self.build_manifest(chunk_id, document_chunk)))
         
+        self._detail(f"  ✓ Created package manifest")
+    
+    def build_readme(self, chunk_id: int, document_chunk: List[Path]) -> str:
+        """Build the README.md text with instructions for team members."""
+        return self.README_TEMPLATE.substitute(
+            chunk_id_str=f"{chunk_id:03d}",
+            doc_count=len(document_chunk),
+            created=self._human_ts,
+        )
+    
+    def create_package_readme(self, package_path: Path, chunk_id: int, document_chunk: List[Path]):
+        """Create a README.md file with instructions for team members."""
         readme_path = package_path / "README.md"
-        with open(readme_path, 'w', encoding='utf-8') as f:
-            f.write(readme_content)
+        readme_path.write_bytes(self.build_readme(chunk_id, document_chunk).encode('utf-8'))
         
-        click.echo(f"  ✓ Created README.md for team members")
+        self._detail(f"  ✓ Created README.md for team members")
     
     def split(self) -> List[Path]:
-        """Main method to split the work."""
+        """Main method to split the work.
+        
+        Document counts of the created packages are kept in package_counts.
+        """
         click.echo(f"🔍 Analyzing source folder: {self.source_folder}")
         
+        # All packages of one run share the same "created" time
+        self._set_run_timestamp()
+        
         # Get all document files
         document_files = self.get_document_files()
         if not document_files:
@@ -245,44 +464,184 @@ If you run into issues:
         # Create output directory
         self.output_folder.mkdir(parents=True, exist_ok=True)
         
-        # Create each work package
+        if self.archive_only:
+            # Archives are written straight from the sources; nothing to stage
+            proto = None
+            create_package = self.create_package_archive
+        else:
+            # Stage the shared files on the output filesystem once, so every
+            # package can hardlink them instead of copying the same bytes again
+            proto = self.stage_prototype()
+            create_package = partial(self.create_work_package, proto=proto)
+        
+        # Create the packages concurrently; they are independent and I/O-bound.
+        # Each worker buffers its output, which is echoed in package order.
         created_packages = []
-        for i, chunk in enumerate(chunks):
-            click.echo(f"\n📦 Creating package {i+1}/{actual_splits}:")
-            package_path = self.create_work_package(i+1, chunk)
-            created_packages.append(package_path)
-            click.echo(f"   Package: {package_path.name} ({len(chunk)} documents)")
+        self.package_counts = {}
+        try:
+            with ThreadPoolExecutor(max_workers=self._max_workers(actual_splits)) as executor, \
+                    self._progress(actual_splits, "   Packages") as bar:
+                futures = [
+                    executor.submit(self._run_buffered, create_package, i+1, chunk)
+                    for i, chunk in enumerate(chunks)
+                ]
+                
+                for i, (chunk, future) in enumerate(zip(chunks, futures)):
+                    package_path, messages = future.result()
+                    created_packages.append(package_path)
+                    self.package_counts[package_path] = len(chunk)
+                    if bar is not None:
+                        bar.update(1)
+                        continue
+                    click.echo(f"\n📦 Creating package {i+1}/{actual_splits}:")
+                    for message in messages:
+                        click.echo(message)
+                    click.echo(f"   Package: {package_path.name} ({len(chunk)} documents)")
+        finally:
+            if proto is not None:
+                shutil.rmtree(proto, ignore_errors=True)
         
         return created_packages
     
     def compress_packages(self, packages: List[Path]) -> List[Path]:
-        """Compress work packages into .tar.gz files."""
+        """Compress work packages into .tar.gz (or .tar.zst) files."""
         compressed_files = []
+        packages = [package_path for package_path in packages if package_path.exists()]
         
         click.echo(f"\n🗜️  Compressing {len(packages)} packages...")
         
-        for package_path in packages:
-            if not package_path.exists():
-                continue
-                
-            # Create .tar.gz file in the same directory
-            archive_name = f"{package_path.name}.tar.gz"
-            archive_path = package_path.parent / archive_name
-            
-            click.echo(f"   Compressing {package_path.name}...")
+        if not packages:
+            return compressed_files
+        
+        # zlib releases the GIL while compressing, so threads overlap the work
+        errors = []
+        with ThreadPoolExecutor(max_workers=self._max_workers(len(packages))) as executor, \
+                self._progress(len(packages), "   Archives") as bar:
+            futures = [executor.submit(self._run_buffered, self.compress_package, package_path)
+                       for package_path in packages]
             
-            try:
-                with tarfile.open(archive_path, "w:gz") as tar:
-                    tar.add(package_path, arcname=package_path.name)
-                
-                compressed_files.append(archive_path)
-                click.echo(f"   ✓ Created {archive_name}")
-                
-            except Exception as e:
-                click.echo(f"   ❌ Error compressing {package_path.name}: {e}")
-                continue
+            for future in futures:
+                archive_path, messages = future.result()
+                if bar is not None:
+                    # Only errors are buffered without --verbose; show them after the bar
+                    bar.update(1)
+                    errors.extend(messages)
+                else:
+                    for message in messages:
+                        click.echo(message)
+                if archive_path is not None:
+                    compressed_files.append(archive_path)
+        
+        for message in errors:
+            click.echo(message)
         
         return compressed_files
+    
+    def compress_package(self, package_path: Path) -> Optional[Path]:
+        """Compress a single work package into an archive next to it."""
+        # Create .tar.gz (or .tar.zst) file in the same directory
+        archive_name = f"{package_path.name}{self.archive_suffix}"
+        archive_path = package_path.parent / archive_name
+        
+        self._detail(f"   Compressing {package_path.name}...")
+        
+        try:
+            if LIBARCHIVE_AVAILABLE and not (self.use_zstd or PIGZ_COMMAND):
+                # libarchive writes tar headers and gzip in C instead of tarfile's Python
+                with libarchive.file_writer(str(archive_path), 'gnutar', 'gzip',
+                                            options=f'compression-level={self.compress_level}') as archive:
+                    archive.add_files(str(package_path), pathname=package_path.name)
+            else:
+                with self._open_tar_stream(archive_path) as tar:
+                    tar.add(package_path, arcname=package_path.name)
+            
+            self._detail(f"   ✓ Created {archive_name}")
+            return archive_path
+            
+        except Exception as e:
+            self._echo(f"   ❌ Error compressing {package_path.name}: {e}")
+            return None
+    
+    @contextmanager
+    def _open_tar_stream(self, archive_path: Path):
+        """Open a write-only tar stream compressed into archive_path.
+        
+        Write-once archives don't need random access, so everything goes
+        through the sequential "w|" mode: into multithreaded zstd with --zstd,
+        through pigz when installed, else through GzipFile (which, unlike
+        "w|gz", takes a compression level).
+        """
+        with open(archive_path, 'wb') as fp:
+            if self.use_zstd:
+                cctx = zstandard.ZstdCompressor(level=10, threads=-1)
+                with cctx.stream_writer(fp) as comp, tarfile.open(fileobj=comp, mode="w|") as tar:
+                    yield tar
+            elif PIGZ_COMMAND:
+                command = [PIGZ_COMMAND, f"-{self.compress_level}", "-p", str(os.cpu_count() or 1), "-c"]
+                proc = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=fp, stderr=subprocess.PIPE)
+                complete = False
+                try:
+                    with tarfile.open(fileobj=proc.stdin, mode="w|") as tar:
+                        yield tar
+                    complete = True
+                except BrokenPipeError:
+                    pass  # pigz exited early; report its own error below
+                except BaseException:
+                    proc.kill()
+                    proc.wait()
+                    raise
+                _, stderr = proc.communicate()
+                
+                if proc.returncode != 0 or not complete:
+                    raise RuntimeError(stderr.decode(errors='replace').strip()
+                                       or f"pigz exited with status {proc.returncode}")
+            else:
+                with gzip.GzipFile(fileobj=fp, mode='wb', compresslevel=self.compress_level) as gz, \
+                        tarfile.open(fileobj=gz, mode="w|") as tar:
+                    yield tar
+    
+    @property
+    def archive_suffix(self) -> str:
+        """File suffix of the compressed package archives."""
+        return ".tar.zst" if self.use_zstd else ".tar.gz"
+    
+    @staticmethod
+    def _max_workers(num_tasks: int) -> int:
+        """Thread count for I/O-bound per-package work."""
+        return max(1, min(num_tasks, (os.cpu_count() or 1) * 2))
+    
+    def _set_run_timestamp(self):
+        """Capture the current time once, formatted for manifests and READMEs."""
+        self._run_timestamp = datetime.now()
+        self._iso_ts = self._run_timestamp.isoformat()
+        self._human_ts = self._run_timestamp.strftime('%Y-%m-%d %H:%M:%S')
+    
+    def _progress(self, length: int, label: str):
+        """Progress bar over package work, or a no-op context in verbose mode."""
+        if self.verbose:
+            return nullcontext()
+        return click.progressbar(length=length, label=label)
+    
+    def _detail(self, message: str):
+        """Echo a per-package step message, only in verbose mode."""
+        if self.verbose:
+            self._echo(message)
+    
+    def _echo(self, message: str):
+        """Echo a message, or buffer it when called from a package worker thread."""
+        messages = getattr(self._thread_state, 'messages', None)
+        if messages is None:
+            click.echo(message)
+        else:
+            messages.append(message)
+    
+    def _run_buffered(self, func, *args):
+        """Run func in a worker thread and return (result, echoed messages)."""
+        messages = self._thread_state.messages = []
+        try:
+            return func(*args), messages
+        finally:
+            self._thread_state.messages = None
 
 
 @click.command()
@@ -302,8 +661,26 @@ If you run into issues:
               is_flag=True,
               default=True,
               help='Automatically compress each package as .tar.gz')
+@click.option('--zstd', '-z',
+              is_flag=True,
+              default=False,
+              help='Compress packages as .tar.zst with multithreaded zstd (requires zstandard)')
+@click.option('--compress-level', '-l',
+              type=click.IntRange(1, 9),
+              default=DEFAULT_COMPRESS_LEVEL,
+              show_default=True,
+              help='gzip level for .tar.gz packages (1 = fastest, 9 = smallest)')
+@click.option('--verbose', '-v',
+              is_flag=True,
+              default=False,
+              help='Print every packaging step instead of a progress bar')
+@click.option('--archive-only', '-a',
+              is_flag=True,
+              default=False,
+              help='Write packages straight into archives without package folders')
 @click.version_option(version='1.0.0', prog_name='AI Docu App Document Splitter')
-def main(source: Path, num_splits: int, output: Path, compress: bool):
+def main(source: Path, num_splits: int, output: Path, compress: bool, zstd: bool,
+         compress_level: int, verbose: bool, archive_only: bool):
     """
     📄 AI Docu App - Document Splitter Tool
     
@@ -327,6 +704,9 @@ def main(source: Path, num_splits: int, output: Path, compress: bool):
     if num_splits > 100:
         raise click.BadParameter("Number of splits cannot exceed 100 (too many packages)")
     
+    if zstd and not ZSTANDARD_AVAILABLE:
+        raise click.BadParameter("--zstd requires the zstandard package (pip install zstandard)")
+    
     # Set default output location
     if output is None:
         output = Path(__file__).parent / "split"
@@ -336,14 +716,18 @@ def main(source: Path, num_splits: int, output: Path, compress: bool):
         click.echo("=" * 45)
         
         # Initialize splitter
-        splitter = DocumentSplitter(source, output, num_splits)
+        splitter = DocumentSplitter(source, output, num_splits, use_zstd=zstd,
+                                    compress_level=compress_level, verbose=verbose,
+                                    archive_only=archive_only)
         
         # Perform the split
         packages = splitter.split()
         
         # Compress packages if requested
         compressed_files = []
-        if compress:
+        if archive_only:
+            compressed_files = packages
+        elif compress:
             compressed_files = splitter.compress_packages(packages)
         
         click.echo(f"\n✅ Successfully created {len(packages)} work packages!")
@@ -353,18 +737,17 @@ def main(source: Path, num_splits: int, output: Path, compress: bool):
         
         # Show summary
         click.echo(f"\n📋 Package Summary:")
-        for i, package in enumerate(packages):
-            manifest_path = package / "package-manifest.json"
-            if manifest_path.exists():
-                with open(manifest_path, 'r') as f:
-                    manifest = json.load(f)
-                document_count = manifest['package_info']['document_count']
-                click.echo(f"   {package.name}: {document_count} documents")
+        for package, document_count in splitter.package_counts.items():
+            click.echo(f"   {package.name}: {document_count} documents")
         
         click.echo(f"\n🚀 Next Steps:")
-        if compress:
-            click.echo(f"1. Share .tar.gz files with team members")
-            click.echo(f"2. Team members extract: tar -xzf docu-package-001.tar.gz")
+        if compress or archive_only:
+            if zstd:
+                click.echo(f"1. Share .tar.zst files with team members")
+                click.echo(f"2. Team members extract: tar --zstd -xf docu-package-001.tar.zst")
+            else:
+                click.echo(f"1. Share .tar.gz files with team members")
+                click.echo(f"2. Team members extract: tar -xzf docu-package-001.tar.gz")
             click.echo(f"3. Team members analyze their assigned documents and send back results")
             click.echo(f"4. Team lead uses join_work.py to merge results")
         else:
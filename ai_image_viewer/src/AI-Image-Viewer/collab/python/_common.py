@@ -0,0 +1,44 @@
+"""
+AI Image Viewer - image listing and JSON helpers shared by split_work.py and join_work.py
+
+Author: AI Image Viewer Team
+"""
+
+import os
+import re
+import json
+from pathlib import Path
+from typing import Any, List
+from operator import attrgetter
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif', '.webp', '.bmp')
+# Case-insensitive suffix test for IMAGE_EXTENSIONS without lowercasing every name
+IMAGE_NAME_RE = re.compile('(?:%s)\\Z' % '|'.join(map(re.escape, IMAGE_EXTENSIONS)), re.IGNORECASE)
+
+
+def dumps_pretty(obj: Any) -> bytes:
+    """Serialize to 2-space indented UTF-8 JSON bytes, with orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def scan_images(path: Path, sort: bool = False) -> List[Path]:
+    """List image files in a folder with one os.scandir pass (any extension case),
+    in directory order or, with sort=True, by name.
+    """
+    with os.scandir(path) as it:
+        entries = [entry for entry in it
+                   if entry.is_file(follow_symlinks=False) and IMAGE_NAME_RE.search(entry.name)]
+    if sort:
+        # DirEntry.name is a plain str attribute, unlike Path.name which is
+        # recomputed on every access, so sort before building the Paths
+        entries.sort(key=attrgetter('name'))
+    return [Path(entry.path) for entry in entries]
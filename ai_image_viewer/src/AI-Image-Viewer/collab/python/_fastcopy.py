@@ -0,0 +1,178 @@
+"""
+AI Image Viewer - file copy helpers shared by split_work.py and join_work.py
+
+Clones file extents instead of copying bytes where the platform allows:
+copy_file_range / FICLONE reflink on Linux CoW filesystems (btrfs, XFS),
+clonefile(2) on macOS APFS, CopyFileW on Windows.
+
+Author: AI Image Viewer Team
+"""
+
+import os
+import sys
+import errno
+import ctypes
+import shutil
+import functools
+from pathlib import Path
+from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+COPY_CHUNK = 1 << 30
+# Bigger buffers for shutil's read/write fallback (default is 64 KiB)
+shutil.COPY_BUFSIZE = 4 << 20
+CLONE_FALLBACK_ERRORS = {errno.EINVAL, errno.ENOSYS, errno.ENOTSUP, errno.EXDEV, errno.EBADF}
+FICLONE = 0x40049409
+
+if sys.platform == 'darwin':
+    try:
+        _clonefile = ctypes.CDLL('/usr/lib/libc.dylib', use_errno=True).clonefile
+    except (OSError, AttributeError):
+        _clonefile = None
+else:
+    _clonefile = None
+
+if sys.platform == 'win32':
+    # CopyFileW copies in the kernel (and server-side on SMB shares)
+    _copy_file_w = ctypes.WinDLL('kernel32', use_last_error=True).CopyFileW
+    _copy_file_w.argtypes = (ctypes.c_wchar_p, ctypes.c_wchar_p, ctypes.c_int)
+    _copy_file_w.restype = ctypes.c_int
+else:
+    _copy_file_w = None
+
+# Image copies are I/O-bound, so use more threads than cores
+DEFAULT_JOBS = min(32, (os.cpu_count() or 1) * 4)
+# Below this many files, starting a thread pool costs more than it saves
+PARALLEL_COPY_MIN_FILES = 16
+
+
+def _copy_in_kernel(src: Path, dst: Path) -> bool:
+    """Copy src to dst without a userspace buffer; False if the platform can't."""
+    linux = sys.platform.startswith('linux')
+    if not (hasattr(os, 'copy_file_range') or fcntl or linux):
+        return False
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        in_fd, out_fd = fsrc.fileno(), fdst.fileno()
+        if hasattr(os, 'copy_file_range'):
+            try:
+                while os.copy_file_range(in_fd, out_fd, COPY_CHUNK):
+                    pass
+                return True
+            except OSError as e:
+                if e.errno not in CLONE_FALLBACK_ERRORS:
+                    raise
+        if fcntl and linux:
+            try:
+                fcntl.ioctl(out_fd, FICLONE, in_fd)
+                return True
+            except OSError:
+                pass
+        if linux:
+            # sendfile still skips the userspace bounce buffer (file-to-file since 2.6.33).
+            # offset=None reads from in_fd's own position, so it resumes in step with
+            # out_fd wherever a failed copy_file_range left both
+            try:
+                while os.sendfile(out_fd, in_fd, None, COPY_CHUNK):
+                    pass
+                return True
+            except OSError as e:
+                if e.errno not in CLONE_FALLBACK_ERRORS:
+                    raise
+    return False
+
+
+def fast_copy(src: Path, dst: Path) -> Path:
+    """Copy a file like shutil.copy2, cloning it instead when the filesystem can."""
+    if _clonefile is not None:
+        # clonefile refuses to replace an existing file
+        if os.path.lexists(dst):
+            os.unlink(dst)
+        if _clonefile(os.fsencode(src), os.fsencode(dst), 0) == 0:
+            return dst
+    if _copy_file_w is not None:
+        if _copy_file_w(os.fspath(src), os.fspath(dst), False):
+            shutil.copystat(src, dst)
+            return dst
+    elif _copy_in_kernel(src, dst):
+        shutil.copystat(src, dst)
+        return dst
+    shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+    return dst
+
+
+def link_or_copy(src, dst):
+    """Hardlink a read-only shared file into a package, copying across filesystems."""
+    # Never write through an existing link: that would modify the source file
+    if os.path.lexists(dst):
+        os.unlink(dst)
+    try:
+        os.link(src, dst)
+    except OSError:
+        fast_copy(src, dst)
+    return dst
+
+
+@functools.lru_cache(maxsize=None)
+def find_project_root(start: Path, html_files: tuple) -> Path:
+    """Walk up from start to the first folder holding all html_files (memoized)."""
+    current = start
+    while current.parent != current:
+        if all(os.path.isfile(current / html) for html in html_files):
+            return current
+        current = current.parent
+    raise FileNotFoundError("Could not find project root with HTML files")
+
+
+def clone_tree(src: Path, dst: Path):
+    """Copy a read-only tree as hardlinks on the same filesystem, else as clones/copies.
+    
+    The device check is done once up front, so a cross-filesystem target
+    doesn't attempt (and fail) one os.link per file.
+    """
+    dst.mkdir(parents=True, exist_ok=True)
+    same_device = os.stat(src).st_dev == os.stat(dst).st_dev
+    shutil.copytree(src, dst, dirs_exist_ok=True,
+                    copy_function=link_or_copy if same_device else fast_copy)
+
+
+def _copy_one(src: Path, dst_dir: Path, copy_function=fast_copy) -> Path:
+    """Copy one file into dst_dir, keeping its name and metadata."""
+    return copy_function(src, dst_dir / src.name)
+
+
+def copy_files(files: List[Path], dst_dir: Path, jobs: int, copy_function=fast_copy,
+               executor: Optional[ThreadPoolExecutor] = None, progress=None) -> int:
+    """Copy files into dst_dir on a thread pool; return how many were copied.
+    
+    Copies spend their time in blocking syscalls that release the GIL, so
+    parallel copies keep the disk (or network share) busy. Pass a running
+    executor to reuse its threads across calls. progress, if given, is a
+    click progress bar advanced once per copied file.
+    """
+    if executor is None and (jobs <= 1 or len(files) < PARALLEL_COPY_MIN_FILES):
+        for src in files:
+            _copy_one(src, dst_dir, copy_function)
+            if progress is not None:
+                progress.update(1)
+        return len(files)
+    
+    copied_count = 0
+    pool = executor or ThreadPoolExecutor(max_workers=min(jobs, len(files)))
+    try:
+        futures = [pool.submit(_copy_one, src, dst_dir, copy_function) for src in files]
+        for future in as_completed(futures):
+            future.result()  # re-raise the first copy error
+            copied_count += 1
+            if progress is not None:
+                progress.update(1)
+    finally:
+        if executor is None:
+            pool.shutdown()
+    return copied_count
@@ -12,40 +12,152 @@ Author: AI Image Viewer Team
 """
 
 import os
+import re
 import shutil
 import json
 import click
 import tarfile
 import tempfile
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from contextlib import nullcontext
 import glob
+import mmap
+
+from _common import IMAGE_EXTENSIONS, dumps_pretty, scan_images
+from _fastcopy import DEFAULT_JOBS, clone_tree, copy_files, find_project_root, link_or_copy
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _load_json(path: Path) -> Any:
+    """Parse a JSON file, with orjson when available.
+    
+    orjson parses straight from a read-only mapping of the file, so the
+    bytes are served from the page cache without a copy into Python.
+    """
+    if ORJSON_AVAILABLE:
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return orjson.loads(b'')  # mmap cannot map empty files
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+# Below this many packages, scanning them one by one beats starting threads
+PARALLEL_SCAN_MIN_PACKAGES = 4
+
+
+def _read_summary(metadata_path: Path) -> Dict[str, Any]:
+    """Read only totalImages and consolidation_info from consolidated metadata.
+    
+    With ijson the file is pull-parsed and reading stops once both keys are
+    found, so the large captions/aiData sections after them are never built.
+    """
+    if not IJSON_AVAILABLE:
+        return _load_json(metadata_path)
+    
+    summary = {}
+    with open(metadata_path, 'rb') as f:
+        for key, value in ijson.kvitems(f, ''):
+            if key in ('totalImages', 'consolidation_info'):
+                summary[key] = value
+                if len(summary) == 2:
+                    break
+    return summary
+
+
+class _MergedSection:
+    """One top-level map (captions or aiData) merged lazily across metadata files.
+    
+    items() streams first-seen (key, value) pairs straight from the source
+    files with ijson, so only one entry is held in memory at a time.
+    """
+    
+    def __init__(self, metadata_files: List[Path], section: str):
+        self.metadata_files = metadata_files
+        self.section = section
+    
+    def items(self):
+        seen = set()
+        for meta_file in self.metadata_files:
+            with open(meta_file, 'rb') as f:
+                for key, value in ijson.kvitems(f, self.section, use_float=True):
+                    # First survives for duplicates; the size check costs one probe
+                    seen_count = len(seen)
+                    seen.add(key)
+                    if len(seen) != seen_count:
+                        yield key, value
+
+
+def _write_metadata(metadata_path: Path, metadata: Dict[str, Any]):
+    """Write metadata in json.dump(indent=2) layout, streaming map values entry by entry.
+    
+    Top-level maps (including _MergedSection) are serialized one entry at a
+    time, so a lazily merged section is never built in memory.
+    """
+    def dumps(value, indent):
+        return dumps_pretty(value).replace(b'\n', b'\n' + indent)
+    
+    with open(metadata_path, 'wb') as f:
+        f.write(b'{')
+        for i, (key, value) in enumerate(metadata.items()):
+            f.write(b',' if i else b'')
+            f.write(b'\n  ' + dumps(key, b'') + b': ')
+            if not hasattr(value, 'items'):
+                f.write(dumps(value, b'  '))
+                continue
+            
+            f.write(b'{')
+            empty = True
+            for sub_key, sub_value in value.items():
+                f.write(b'' if empty else b',')
+                f.write(b'\n    ' + dumps(sub_key, b'') + b': ' + dumps(sub_value, b'    '))
+                empty = False
+            f.write(b'}' if empty else b'\n  }')
+        f.write(b'\n}')
 
 
 class WorkJoiner:
     """Handles merging multiple work packages into a single consolidated package."""
     
-    SUPPORTED_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.gif', '.webp', '.bmp'}
+    SUPPORTED_EXTENSIONS = set(IMAGE_EXTENSIONS)
     HTML_FILES = [
         'ai_image.html'
     ]
-    # Removed METADATA_PATTERNS - now using flexible filename detection
+    # Removed METADATA_PATTERNS - now using flexible filename detection:
+    # any *.json whose name contains "metadata" in any case
+    METADATA_FILE_RE = re.compile(r'.*(?i:metadata).*\.json', re.DOTALL)
     
-    def __init__(self, package_paths: List[Path], output_path: Path):
+    def __init__(self, package_paths: List[Path], output_path: Path, jobs: int = DEFAULT_JOBS,
+                 verbose: bool = False):
         self.package_paths = [Path(p) for p in package_paths]
         self.output_path = Path(output_path)
+        self.jobs = jobs
+        self.verbose = verbose
         self.project_root = self.find_project_root()
         self.temp_dir = None  # For extracted .tar.gz files
         
     def find_project_root(self) -> Path:
         """Find the project root containing HTML files."""
-        current = Path(__file__).parent
-        while current.parent != current:
-            if all((current / html).exists() for html in self.HTML_FILES):
-                return current
-            current = current.parent
-        raise FileNotFoundError("Could not find project root with HTML files")
+        return find_project_root(Path(__file__).resolve().parent, tuple(self.HTML_FILES))
     
     def detect_and_extract_archives(self) -> List[Path]:
         """Detect .tar.gz files and directories, extract archives if needed."""
@@ -73,8 +185,10 @@ class WorkJoiner:
         if archive_files:
             click.echo(f"🗜️  Found {len(archive_files)} compressed packages to extract...")
             
-            # Create temporary directory for extraction
-            self.temp_dir = Path(tempfile.mkdtemp(prefix="ai-image-join-"))
+            # Create temporary directory for extraction, next to the output when
+            # possible so extracted images can be hardlinked rather than copied
+            temp_parent = self.output_path.parent if self.output_path.parent.is_dir() else None
+            self.temp_dir = Path(tempfile.mkdtemp(prefix="ai-image-join-", dir=temp_parent))
             
             for archive_file in archive_files:
                 click.echo(f"📦 Extracting {archive_file.name}...")
@@ -135,16 +249,12 @@ class WorkJoiner:
         """Collect all image files from packages."""
         all_images = []
         seen_names = set()
+        duplicate_count = 0
         
-        for package in packages:
-            images_path = package / "images"
-            if not images_path.exists():
+        # Scan packages (possibly in parallel), then dedup serially in package order
+        for package, package_images in zip(packages, self._map_packages(self._scan_package_images, packages)):
+            if package_images is None:
                 continue
-                
-            package_images = []
-            for ext in self.SUPPORTED_EXTENSIONS:
-                package_images.extend(images_path.glob(f"*{ext}"))
-                package_images.extend(images_path.glob(f"*{ext.upper()}"))
             
             click.echo(f"📸 Package {package.name}: {len(package_images)} images")
             
@@ -152,52 +262,72 @@ class WorkJoiner:
                 original_name = img.name
                 if original_name in seen_names:
                     # Skip duplicates - first survives
-                    click.echo(f"  ⚠️  Skipping duplicate image: {original_name} (first survives)")
+                    duplicate_count += 1
+                    self._detail(f"  ⚠️  Skipping duplicate image: {original_name} (first survives)")
                     continue
                 else:
                     all_images.append(img)
                     seen_names.add(original_name)
         
+        if duplicate_count and not self.verbose:
+            click.echo(f"  ⚠️  Skipped {duplicate_count} duplicate images (first survives)")
+        
         return all_images
     
     def find_metadata_files(self, packages: List[Path]) -> List[Path]:
         """Find all metadata JSON files in packages using flexible filename detection."""
         metadata_files = []
         
-        for package in packages:
-            found_in_package = []
-            
-            # Find all .json files in the package
-            json_files = list(package.glob("*.json"))
-            
-            # Filter for files containing "metadata" (case-insensitive)
-            for json_file in json_files:
-                filename_lower = json_file.name.lower()
-                if "metadata" in filename_lower:
-                    # Exclude package-manifest.json (not analysis data)
-                    if json_file.name != "package-manifest.json":
-                        found_in_package.append(json_file)
-            
+        for package, found_in_package in zip(packages, self._map_packages(self._scan_package_metadata, packages)):
             if found_in_package:
                 click.echo(f"📊 Package {package.name}: {len(found_in_package)} metadata files")
                 for meta_file in found_in_package:
-                    click.echo(f"  - {meta_file.name}")
+                    self._detail(f"  - {meta_file.name}")
                 metadata_files.extend(found_in_package)
             else:
                 click.echo(f"⚠️  Package {package.name}: No metadata files found")
         
         return metadata_files
     
+    def _scan_package_images(self, package: Path) -> Optional[List[Path]]:
+        """Image files of one package, or None if it has no images folder."""
+        images_path = package / "images"
+        if not images_path.exists():
+            return None
+        return scan_images(images_path)
+    
+    def _scan_package_metadata(self, package: Path) -> List[Path]:
+        """Metadata JSON files of one package."""
+        # One directory pass, matching "*metadata*.json" names directly
+        # (package-manifest.json never matches, so it is excluded too)
+        with os.scandir(package) as it:
+            return [Path(entry.path) for entry in it
+                    if self.METADATA_FILE_RE.fullmatch(entry.name) and entry.is_file()]
+    
+    @staticmethod
+    def _map_packages(func, packages: List[Path]) -> List[Any]:
+        """Apply func to every package, in threads when there are enough of them.
+        
+        Directory listing is syscall-bound and releases the GIL, so threads
+        overlap the latency (e.g. on network shares). Results keep package order.
+        """
+        if len(packages) <= PARALLEL_SCAN_MIN_PACKAGES:
+            return [func(package) for package in packages]
+        with ThreadPoolExecutor(max_workers=min(32, len(packages))) as executor:
+            return list(executor.map(func, packages))
+    
     def merge_metadata(self, metadata_files: List[Path]) -> Dict[str, Any]:
         """Merge multiple metadata JSON files into a single consolidated metadata."""
+        # One timestamp for both fields, so they never drift apart
+        now_iso = datetime.now().isoformat()
         merged = {
             "version": "2.0-Consolidated",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now_iso,
             "appName": "AI Image Viewer - Consolidated Results",
             "consolidation_info": {
                 "source_files": [f.name for f in metadata_files],
                 "packages_merged": len(set(f.parent.name for f in metadata_files)),
-                "merge_date": datetime.now().isoformat()
+                "merge_date": now_iso
             },
             "totalImages": 0,
             "aiEnabled": True,
@@ -205,30 +335,34 @@ class WorkJoiner:
             "aiData": {}
         }
         
+        if IJSON_AVAILABLE:
+            return self._merge_metadata_streaming(metadata_files, merged)
+        
         image_count = 0
         models_used = set()
         
         for meta_file in metadata_files:
             try:
-                with open(meta_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                data = _load_json(meta_file)
                 
                 package_name = meta_file.parent.name
-                click.echo(f"📋 Processing: {meta_file.name}")
+                self._detail(f"📋 Processing: {meta_file.name}")
                 
                 # Merge captions - first survives for duplicates
                 if 'captions' in data:
-                    for img_name, caption in data['captions'].items():
-                        if img_name not in merged['captions']:
-                            merged['captions'][img_name] = caption
-                        # Skip if duplicate - first survives
+                    captions = merged['captions']
+                    if not captions:
+                        captions.update(data['captions'])
+                    else:
+                        # setdefault keeps an existing entry in a single probe
+                        for img_name, caption in data['captions'].items():
+                            captions.setdefault(img_name, caption)
                 
                 # Merge AI data - first survives for duplicates
                 if 'aiData' in data:
+                    merged_ai_data = merged['aiData']
                     for img_name, ai_data in data['aiData'].items():
-                        if img_name not in merged['aiData']:
-                            merged['aiData'][img_name] = ai_data
-                        # Skip if duplicate - first survives
+                        merged_ai_data.setdefault(img_name, ai_data)
                         
                         # Track models used
                         if 'modelUsed' in ai_data:
@@ -251,6 +385,58 @@ class WorkJoiner:
         
         return merged
     
+    def _merge_metadata_streaming(self, metadata_files: List[Path], merged: Dict[str, Any]) -> Dict[str, Any]:
+        """merge_metadata with ijson: gather stats now, stream captions/aiData at write time.
+        
+        Each file is pull-parsed once, collecting totalImages and the aiData
+        keys and models from the same event stream; files that fail to parse
+        are left out of the merge, as before. captions and aiData become
+        _MergedSection objects read by _write_metadata.
+        """
+        image_count = 0
+        models_used = set()
+        analyzed_images = set()
+        valid_files = []
+        
+        for meta_file in metadata_files:
+            try:
+                # Track models used and the (first-seen) analyzed images; entries
+                # are never built, only their modelUsed value is picked out
+                file_count = 0
+                model_prefix = None
+                with open(meta_file, 'rb') as f:
+                    for prefix, event, value in ijson.parse(f, use_float=True):
+                        if prefix == model_prefix:
+                            if event in ('start_map', 'start_array'):
+                                raise TypeError(f"modelUsed is not a plain value in {meta_file.name}")
+                            models_used.add(value)
+                        elif prefix == 'aiData' and event == 'map_key':
+                            analyzed_images.add(value)
+                            model_prefix = f'aiData.{value}.modelUsed'
+                        elif prefix == 'totalImages':
+                            file_count += value
+                
+                self._detail(f"📋 Processing: {meta_file.name}")
+                image_count += file_count
+                valid_files.append(meta_file)
+                
+            except ijson.JSONError as e:
+                # yajl messages run over several lines with a caret; keep the first
+                message = str(e).partition('\n')[0]
+                click.echo(f"❌ Error parsing {meta_file.name}: {message}")
+                continue
+            except Exception as e:
+                click.echo(f"⚠️  Warning processing {meta_file.name}: {e}")
+                continue
+        
+        merged['totalImages'] = image_count
+        merged['consolidation_info']['models_used'] = list(models_used)
+        merged['consolidation_info']['total_analyzed_images'] = len(analyzed_images)
+        merged['captions'] = _MergedSection(valid_files, 'captions')
+        merged['aiData'] = _MergedSection(valid_files, 'aiData')
+        
+        return merged
+    
     def create_consolidated_package(self, images: List[Path], metadata: Dict[str, Any]) -> Path:
         """Create the final consolidated package."""
         click.echo(f"📦 Creating consolidated package: {self.output_path}")
@@ -263,32 +449,36 @@ class WorkJoiner:
             src_path = self.project_root / html_file
             dst_path = self.output_path / html_file
             if src_path.exists():
-                shutil.copy2(src_path, dst_path)
+                link_or_copy(src_path, dst_path)
                 click.echo(f"✓ Copied {html_file}")
         
         # Copy docs folder if it exists
         docs_src = self.project_root / "docs"
         if docs_src.exists():
             docs_dst = self.output_path / "docs"
-            shutil.copytree(docs_src, docs_dst, dirs_exist_ok=True)
+            clone_tree(docs_src, docs_dst)
             click.echo(f"✓ Copied docs folder")
         
         # Create images folder and copy all images
         images_dst = self.output_path / "images"
         images_dst.mkdir(exist_ok=True)
         
-        copied_count = 0
-        for img_path in images:
-            dst_path = images_dst / img_path.name
-            shutil.copy2(img_path, dst_path)
-            copied_count += 1
+        # Images extracted from archives are deleted afterwards, so link them
+        # into place instead of writing a second copy of their bytes
+        extracted = set()
+        if self.temp_dir:
+            extracted = {img for img in images if self.temp_dir in img.parents}
+        with self._progress(len(images), "   Images") as bar:
+            copied_count = copy_files([img for img in images if img not in extracted],
+                                       images_dst, self.jobs, progress=bar)
+            copied_count += copy_files(list(extracted), images_dst, self.jobs,
+                                        copy_function=link_or_copy, progress=bar)
         
         click.echo(f"✓ Copied {copied_count} images")
         
         # Save consolidated metadata
         metadata_path = self.output_path / "consolidated-metadata.json"
-        with open(metadata_path, 'w', encoding='utf-8') as f:
-            json.dump(metadata, f, indent=2, ensure_ascii=False)
+        _write_metadata(metadata_path, metadata)
         
         click.echo(f"✓ Created consolidated metadata")
         
@@ -301,29 +491,42 @@ class WorkJoiner:
         """Create a human-readable summary report."""
         report_path = self.output_path / "consolidation-report.txt"
         
-        with open(report_path, 'w', encoding='utf-8') as f:
-            f.write("🧠 AI Image Viewer - Consolidation Report\n")
-            f.write("=" * 50 + "\n\n")
-            
-            f.write(f"Consolidation Date: {metadata['consolidation_info']['merge_date']}\n")
-            f.write(f"Packages Merged: {metadata['consolidation_info']['packages_merged']}\n")
-            f.write(f"Source Files: {len(metadata['consolidation_info']['source_files'])}\n")
-            f.write(f"Total Images: {metadata['totalImages']}\n")
-            f.write(f"Analyzed Images: {metadata['consolidation_info']['total_analyzed_images']}\n")
-            f.write(f"Analysis Coverage: {metadata['consolidation_info']['total_analyzed_images']/metadata['totalImages']*100:.1f}%\n\n")
-            
-            if metadata['consolidation_info']['models_used']:
-                f.write("AI Models Used:\n")
-                for model in metadata['consolidation_info']['models_used']:
-                    f.write(f"  - {model}\n")
-                f.write("\n")
-            
-            f.write("Source Metadata Files:\n")
-            for source_file in metadata['consolidation_info']['source_files']:
-                f.write(f"  - {source_file}\n")
+        info = metadata['consolidation_info']
+        lines = [
+            "🧠 AI Image Viewer - Consolidation Report\n",
+            "=" * 50 + "\n\n",
+            f"Consolidation Date: {info['merge_date']}\n",
+            f"Packages Merged: {info['packages_merged']}\n",
+            f"Source Files: {len(info['source_files'])}\n",
+            f"Total Images: {metadata['totalImages']}\n",
+            f"Analyzed Images: {info['total_analyzed_images']}\n",
+            f"Analysis Coverage: {info['total_analyzed_images']/metadata['totalImages']*100:.1f}%\n\n",
+        ]
+        
+        if info['models_used']:
+            lines.append("AI Models Used:\n")
+            lines.extend(f"  - {model}\n" for model in info['models_used'])
+            lines.append("\n")
+        
+        lines.append("Source Metadata Files:\n")
+        lines.extend(f"  - {source_file}\n" for source_file in info['source_files'])
+        
+        # One write for the whole report
+        report_path.write_text(''.join(lines), encoding='utf-8')
         
         click.echo(f"✓ Created consolidation report")
     
+    def _progress(self, length: int, label: str):
+        """Progress bar over per-file work, or a no-op context in verbose mode."""
+        if self.verbose:
+            return nullcontext()
+        return click.progressbar(length=length, label=label)
+    
+    def _detail(self, message: str):
+        """Echo a per-file message, only in verbose mode."""
+        if self.verbose:
+            click.echo(message)
+    
     def join(self) -> Path:
         """Main method to join work packages."""
         try:
@@ -355,14 +558,15 @@ class WorkJoiner:
             
             if not metadata_files:
                 click.echo("⚠️  No metadata files found. Creating package with images only.")
+                now_iso = datetime.now().isoformat()
                 merged_metadata = {
                     "version": "2.0-Consolidated",
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": now_iso,
                     "appName": "AI Image Viewer - Consolidated Results",
                     "consolidation_info": {
                         "source_files": [],
                         "packages_merged": len(valid_packages),
-                        "merge_date": datetime.now().isoformat(),
+                        "merge_date": now_iso,
                         "models_used": [],
                         "total_analyzed_images": 0
                     },
@@ -396,8 +600,17 @@ class WorkJoiner:
               is_flag=True,
               default=True,
               help='Force overwrite existing output directory')
+@click.option('--jobs', '-j',
+              type=click.IntRange(min=1),
+              default=DEFAULT_JOBS,
+              show_default=True,
+              help='Number of parallel image copies')
+@click.option('--verbose', '-v',
+              is_flag=True,
+              default=False,
+              help='List every metadata file and skipped duplicate')
 @click.version_option(version='1.0.0', prog_name='AI Image Viewer Work Joiner')
-def main(packages: List[Path], output: Path, force: bool):
+def main(packages: List[Path], output: Path, force: bool, jobs: int, verbose: bool):
     """
     🧠 AI Image Viewer - Work Joiner Tool
     
@@ -443,7 +656,7 @@ def main(packages: List[Path], output: Path, force: bool):
         click.echo("=" * 43)
         
         # Initialize joiner
-        joiner = WorkJoiner(packages, output)
+        joiner = WorkJoiner(packages, output, jobs=jobs, verbose=verbose)
         
         # Perform the join
         result_path = joiner.join()
@@ -454,8 +667,7 @@ def main(packages: List[Path], output: Path, force: bool):
         # Show final summary
         metadata_path = result_path / "consolidated-metadata.json"
         if metadata_path.exists():
-            with open(metadata_path, 'r') as f:
-                metadata = json.load(f)
+            metadata = _read_summary(metadata_path)
             
             click.echo(f"\n📋 Final Summary:")
             click.echo(f"   Total Images: {metadata['totalImages']}")
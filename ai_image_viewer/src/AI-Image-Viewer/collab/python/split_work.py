@@ -13,103 +13,331 @@ Author: AI Image Viewer Team
 
 import os
 import shutil
-import math
+import stat
+import subprocess
+import string
+import functools
 import click
 import tarfile
+import threading
+import io
 from pathlib import Path
-from typing import List, Tuple
-import json
+from typing import List, Tuple, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from contextlib import contextmanager, nullcontext
+from operator import attrgetter
+import mmap
+
+from _common import IMAGE_EXTENSIONS, dumps_pretty, scan_images
+from _fastcopy import DEFAULT_JOBS, clone_tree, copy_files, fast_copy, find_project_root, link_or_copy
+
+try:
+    import grp
+    import pwd
+except ImportError:  # Windows
+    grp = pwd = None
+
+try:
+    import zstandard
+    ZSTANDARD_AVAILABLE = True
+except ImportError:
+    ZSTANDARD_AVAILABLE = False
+
+
+def _executable(info: tarfile.TarInfo) -> tarfile.TarInfo:
+    """tarfile filter marking a member executable."""
+    info.mode = 0o755
+    return info
+
+
+# Read buffer for streaming files into archives (tarfile's default is 16 KiB)
+TAR_COPY_BUFSIZE = 1 << 20
+# Smaller files are read normally; mapping them costs more than it saves
+MMAP_MIN_SIZE = 128 << 10
+# Parallel gzip for .tar.gz archives when installed; tarfile's zlib otherwise
+PIGZ = shutil.which('pigz')
+
+
+@functools.lru_cache(maxsize=None)
+def _owner_names(uid: int, gid: int) -> Tuple[str, str]:
+    """User and group names for tar headers, looked up once per owner."""
+    uname = gname = ""
+    if pwd is not None:
+        try:
+            uname = pwd.getpwuid(uid).pw_name
+        except KeyError:
+            pass
+        try:
+            gname = grp.getgrgid(gid).gr_name
+        except KeyError:
+            pass
+    return uname, gname
+
+
+def _stat_tarinfo(name: str, st: os.stat_result) -> tarfile.TarInfo:
+    """TarInfo for a file or directory from an existing stat result."""
+    info = tarfile.TarInfo(name)
+    info.mode = stat.S_IMODE(st.st_mode)
+    info.uid, info.gid = st.st_uid, st.st_gid
+    info.uname, info.gname = _owner_names(st.st_uid, st.st_gid)
+    info.mtime = st.st_mtime
+    if stat.S_ISDIR(st.st_mode):
+        info.type = tarfile.DIRTYPE
+    else:
+        info.size = st.st_size
+    return info
+
+
+@contextmanager
+def _open_source(path, size: int):
+    """Open a file for tarfile to read, memory-mapped when it is large.
+    
+    tarfile only calls read(), which an mmap serves straight from the page
+    cache instead of through a file object's buffer.
+    """
+    with open(path, 'rb') as f:
+        if size < MMAP_MIN_SIZE:
+            yield f
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            yield mm
+
+
+def _add_file(tar: tarfile.TarFile, path, arcname: str, st: os.stat_result):
+    """Add one regular file to an archive from its stat result."""
+    with _open_source(path, st.st_size) as f:
+        tar.addfile(_stat_tarinfo(arcname, st), f)
+
+
+def _add_tree(tar: tarfile.TarFile, path, arcname: str):
+    """Add a folder to an archive, like tar.add with dereference=True.
+    
+    Walks with os.scandir and builds each header from the entry's single
+    stat, instead of tarfile's listdir + stat per member.
+    """
+    tar.addfile(_stat_tarinfo(arcname, os.stat(path)))
+    with os.scandir(path) as it:
+        entries = sorted(it, key=attrgetter('name'))
+    for entry in entries:
+        member_name = f"{arcname}/{entry.name}"
+        if entry.is_dir():
+            _add_tree(tar, entry.path, member_name)
+        elif entry.is_file():
+            _add_file(tar, entry.path, member_name, entry.stat())
 
 
 class WorkSplitter:
     """Handles splitting image datasets into collaborative work packages."""
     
-    SUPPORTED_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.gif', '.webp', '.bmp'}
+    SUPPORTED_EXTENSIONS = set(IMAGE_EXTENSIONS)
     HTML_FILES = [
         'ai_image.html'
     ]
+    # Archive suffix and matching extract command per --compression choice
+    ARCHIVE_FORMATS = {
+        'gzip': ('.tar.gz', 'tar -xzf'),
+        'zstd': ('.tar.zst', 'tar --zstd -xf'),
+        'none': ('.tar', 'tar -xf'),
+    }
+    # --compression auto stores a package uncompressed when images (already
+    # entropy-coded JPEG/PNG/WEBP/GIF) make up more than this share of its bytes
+    STORE_ONLY_IMAGE_SHARE = 0.8
     
-    def __init__(self, source_folder: Path, output_folder: Path, num_splits: int):
+    # Team member instructions, filled in per package by build_readme
+    README_TEMPLATE = string.Template("""# AI Image Analysis Work Package
+
+📦 **Package:** work-package-${chunk_id_str}  
+🖼️ **Images to analyze:** ${image_count}  
+📅 **Created:** ${created}
+
+## 🚀 Quick Start
+
+### 1. Open the AI Image Viewer
+Open the HTML file in your web browser:
+- `ai_image.html` - Unified viewer with all AI models (MobileNet, EfficientNet, MediaPipe)
+
+### 2. Load Images
+- Click **"📂 Select Folder"** and choose the `images/` folder
+- Or click **"📁 Select Images"** to load individual files
+- You should see ${image_count} images loaded
+
+### 3. Choose AI Model and Analyze
+- Select your preferred AI model from the dropdown (MobileNet, EfficientNet, or MediaPipe)
+- Click the **AI Analyze** button 🤖
+- Wait for analysis to complete (progress bar will show status)
+- All images will get AI-generated tags and descriptions
+
+### 4. Export Results
+- Click **"💾 Export Metadata"** button
+- This saves a `.json` file with all analysis results
+- The filename will be based on your selected model: `ai-image-mobilenet-metadata.json`, `ai-image-efficientnet-metadata.json`, or `ai-image-mediapipe-metadata.json`
+
+### 5. Send Back to Team Lead
+- **Compress this entire folder** (including the new metadata file):
+  ```bash
+  # Easy way: Use the included script
+  ./compress-package.sh
+  
+  # Manual way: 
+  cd ..
+  tar -czf work-package-${chunk_id_str}-completed.tar.gz work-package-${chunk_id_str}/
+  ```
+- **Send the compressed file** back to your team lead
+- Team lead will merge all results using the join tool
+
+## 📝 Tips
+
+- **Edit captions**: Click on any image caption to edit it manually
+- **Search**: Use the search feature to find specific images
+- **Grid layout**: Adjust how many images per row (1-6)
+- **Model comparison**: Try different models to compare accuracy
+
+## 🔍 File Structure
+
+```
+work-package-${chunk_id_str}/
+├── README.md                              # This file
+├── compress-package.sh                    # Script to compress your completed work
+├── ai_image.html                          # Unified AI viewer (all models)
+├── docs/                                  # Documentation assets
+├── images/                                # Your ${image_count} images to analyze
+├── package-manifest.json                 # Package info
+└── [exported-metadata].json              # Your analysis results (after export)
+```
+
+## ❓ Questions?
+
+If you run into issues:
+1. Make sure you're using a modern web browser (Chrome, Firefox, Safari, Edge)
+2. Check the browser console for any error messages
+3. Try a different AI model if one isn't working
+4. Contact your team lead for help
+
+**Happy analyzing! 🚀**
+""")
+    
+    def __init__(self, source_folder: Path, output_folder: Path, num_splits: int,
+                 jobs: int = DEFAULT_JOBS, compression: str = 'gzip', verbose: bool = False,
+                 archive_only: bool = False, link_images: Optional[bool] = None,
+                 docs_symlink: bool = False):
         self.source_folder = Path(source_folder)
         self.output_folder = Path(output_folder)
         self.num_splits = num_splits
+        self.jobs = jobs
+        self.compression = compression
+        self.verbose = verbose
+        self.archive_only = archive_only
+        self.link_images = link_images  # None: link when source and output share a filesystem
+        self.docs_symlink = docs_symlink
+        self._shared_docs = None
+        self._copy_pool = None  # image copy threads shared by all packages of a split
+        self._thread_state = threading.local()
+        # Shared project files read once per run: path -> (bytes, stat result)
+        self._file_cache: Dict[Path, Tuple[bytes, os.stat_result]] = {}
+        self._set_run_timestamp()
         self.project_root = self.find_project_root()
         
     def find_project_root(self) -> Path:
         """Find the project root containing HTML files."""
-        current = Path(__file__).parent
-        while current.parent != current:
-            if all((current / html).exists() for html in self.HTML_FILES):
-                return current
-            current = current.parent
-        raise FileNotFoundError("Could not find project root with HTML files")
+        return find_project_root(Path(__file__).resolve().parent, tuple(self.HTML_FILES))
+    
+    def place_html_file(self, src_path: Path, dst_path: Path):
+        """Hardlink an HTML file into a package, else write it from the in-memory cache."""
+        if os.path.lexists(dst_path):
+            os.unlink(dst_path)
+        try:
+            os.link(src_path, dst_path)
+        except OSError:
+            self.write_cached_file(src_path, dst_path)
+    
+    def write_cached_file(self, src_path: Path, dst_path: Path):
+        """Write a shared project file into a package from memory, keeping its mtime.
+        
+        The source is read and stat'ed once per splitter, not once per package.
+        """
+        cached = self._file_cache.get(src_path)
+        if cached is None:
+            cached = self._file_cache[src_path] = (src_path.read_bytes(), os.stat(src_path))
+        data, st = cached
+        dst_path.write_bytes(data)
+        os.utime(dst_path, ns=(st.st_atime_ns, st.st_mtime_ns))
     
     def get_image_files(self) -> List[Path]:
-        """Get all supported image files from source folder."""
-        image_files = []
-        for ext in self.SUPPORTED_EXTENSIONS:
-            image_files.extend(self.source_folder.glob(f"*{ext}"))
-            image_files.extend(self.source_folder.glob(f"*{ext.upper()}"))
-        return sorted(image_files)
+        """Get all supported image files from source folder, sorted by name."""
+        # scandir order depends on the filesystem, so the name sort keeps the
+        # package split reproducible across machines
+        return scan_images(self.source_folder, sort=True)
     
     def split_images(self, image_files: List[Path]) -> List[List[Path]]:
-        """Split image files into roughly equal chunks."""
+        """Split image files into balanced chunks (sizes differ by at most one)."""
         if not image_files:
             raise ValueError("No image files found in source folder")
-            
-        chunk_size = math.ceil(len(image_files) / self.num_splits)
+        
+        # The first `extra` chunks take one more image, e.g. 10 over 3 -> 4, 3, 3
+        num_chunks = min(self.num_splits, len(image_files))
+        chunk_size, extra = divmod(len(image_files), num_chunks)
         chunks = []
         
-        for i in range(self.num_splits):
-            start_idx = i * chunk_size
-            end_idx = min((i + 1) * chunk_size, len(image_files))
-            chunk = image_files[start_idx:end_idx]
-            if chunk:  # Only add non-empty chunks
-                chunks.append(chunk)
+        start_idx = 0
+        for i in range(num_chunks):
+            end_idx = start_idx + chunk_size + (i < extra)
+            chunks.append(image_files[start_idx:end_idx])
+            start_idx = end_idx
                 
         return chunks
     
     def create_work_package(self, chunk_id: int, image_chunk: List[Path]) -> Path:
-        """Create a complete work package with HTML files and images."""
+        """Create a complete work package with HTML files and images.
+        
+        Fills the package and images/ folders that split() lays out up front.
+        """
         package_name = f"work-package-{chunk_id:03d}"
         package_path = self.output_folder / package_name
         
-        # Create package directory
-        package_path.mkdir(parents=True, exist_ok=True)
-        
         # Copy HTML files
         for html_file in self.HTML_FILES:
             src_path = self.project_root / html_file
             dst_path = package_path / html_file
-            shutil.copy2(src_path, dst_path)
-            click.echo(f"  ✓ Copied {html_file}")
+            self.place_html_file(src_path, dst_path)
+            self._detail(f"  ✓ Copied {html_file}")
         
         # Copy docs folder if it exists
         docs_src = self.project_root / "docs"
         if docs_src.exists():
             docs_dst = package_path / "docs"
-            shutil.copytree(docs_src, docs_dst, dirs_exist_ok=True)
-            click.echo(f"  ✓ Copied docs folder")
+            if self._shared_docs is not None:
+                # One relative symlink instead of one link/copy per docs file
+                if docs_dst.is_dir() and not docs_dst.is_symlink():
+                    shutil.rmtree(docs_dst)
+                elif os.path.lexists(docs_dst):
+                    os.unlink(docs_dst)
+                os.symlink(os.path.relpath(self._shared_docs, package_path), docs_dst,
+                           target_is_directory=True)
+                self._detail(f"  ✓ Linked shared docs folder")
+            else:
+                clone_tree(docs_src, docs_dst)
+                self._detail(f"  ✓ Copied docs folder")
         
         # Copy compression script for team members
         compress_script = self.project_root / "collab" / "compress-packages.sh"
         if compress_script.exists():
             dst_script = package_path / "compress-package.sh"
-            shutil.copy2(compress_script, dst_script)
+            # Written from memory (not hardlinked) since it's chmod-ed per package
+            self.write_cached_file(compress_script, dst_script)
             # Make executable
             dst_script.chmod(0o755)
-            click.echo(f"  ✓ Copied compression script")
+            self._detail(f"  ✓ Copied compression script")
         
-        # Create images subfolder and copy images
+        # Copy images
         images_path = package_path / "images"
-        images_path.mkdir(exist_ok=True)
-        
-        for img_file in image_chunk:
-            dst_path = images_path / img_file.name
-            shutil.copy2(img_file, dst_path)
+        copy_files(image_chunk, images_path, self.jobs,
+                    copy_function=link_or_copy if self._link_images else fast_copy,
+                    executor=self._copy_pool)
             
-        click.echo(f"  ✓ Copied {len(image_chunk)} images")
+        self._detail(f"  ✓ Copied {len(image_chunk)} images")
         
         # Create package manifest
         self.create_manifest(package_path, chunk_id, image_chunk)
@@ -119,13 +347,70 @@ class WorkSplitter:
         
         return package_path
     
-    def create_manifest(self, package_path: Path, chunk_id: int, image_chunk: List[Path]):
-        """Create a manifest file describing the package contents."""
-        manifest = {
+    def create_package_archive(self, chunk_id: int, image_chunk: List[Path]) -> Path:
+        """Write a work package straight into a compressed archive.
+        
+        Same contents as create_work_package + compress_package, but files are
+        streamed from their sources without staging a package folder on disk.
+        """
+        package_name = f"work-package-{chunk_id:03d}"
+        image_stats = [os.stat(img_file) for img_file in image_chunk]
+        compression = self.choose_compression(sum(st.st_size for st in image_stats))
+        archive_path = self.output_folder / f"{package_name}{self.ARCHIVE_FORMATS[compression][0]}"
+        
+        with self._open_tar(archive_path, compression) as tar:
+            tar.addfile(self._tar_member(package_name, directory=True))
+            
+            for html_file in self.HTML_FILES:
+                tar.add(self.project_root / html_file, arcname=f"{package_name}/{html_file}")
+                self._detail(f"  ✓ Added {html_file}")
+            
+            docs_src = self.project_root / "docs"
+            if docs_src.exists():
+                tar.add(docs_src, arcname=f"{package_name}/docs")
+                self._detail(f"  ✓ Added docs folder")
+            
+            compress_script = self.project_root / "collab" / "compress-packages.sh"
+            if compress_script.exists():
+                tar.add(compress_script, arcname=f"{package_name}/compress-package.sh",
+                        filter=_executable)
+                self._detail(f"  ✓ Added compression script")
+            
+            tar.addfile(self._tar_member(f"{package_name}/images", directory=True))
+            for img_file, st in zip(image_chunk, image_stats):
+                _add_file(tar, img_file, f"{package_name}/images/{img_file.name}", st)
+            self._detail(f"  ✓ Added {len(image_chunk)} images")
+            
+            # Generated files go in from memory
+            for name, data in (
+                ("package-manifest.json", dumps_pretty(self.build_manifest(chunk_id, image_chunk))),
+                ("README.md", self.build_readme(chunk_id, image_chunk).encode('utf-8')),
+            ):
+                tar.addfile(self._tar_member(f"{package_name}/{name}", size=len(data)), io.BytesIO(data))
+            self._detail(f"  ✓ Added package manifest and README.md")
+        
+        self._detail(f"  ✓ Created {archive_path.name}")
+        return archive_path
+    
+    def _tar_member(self, name: str, size: int = 0, directory: bool = False) -> tarfile.TarInfo:
+        """TarInfo for a generated archive member."""
+        info = tarfile.TarInfo(name)
+        info.mtime = self._run_timestamp.timestamp()
+        if directory:
+            info.type = tarfile.DIRTYPE
+            info.mode = 0o755
+        else:
+            info.size = size
+            info.mode = 0o644
+        return info
+    
+    def build_manifest(self, chunk_id: int, image_chunk: List[Path]) -> dict:
+        """Build the manifest describing the package contents."""
+        return {
             "package_info": {
                 "id": chunk_id,
                 "name": f"work-package-{chunk_id:03d}",
-                "created": datetime.now().isoformat(),
+                "created": self._iso_ts,
                 "total_packages": self.num_splits,
                 "image_count": len(image_chunk)
             },
@@ -139,97 +424,40 @@ class WorkSplitter:
                 "5": "Share the exported JSON file back to the project lead"
             }
         }
-        
+    
+    def create_manifest(self, package_path: Path, chunk_id: int, image_chunk: List[Path]):
+        """Create a manifest file describing the package contents."""
         manifest_path = package_path / "package-manifest.json"
-        with open(manifest_path, 'w', encoding='utf-8') as f:
-            json.dump(manifest, f, indent=2, ensure_ascii=False)
+        manifest_path.write_bytes(dumps_pretty(self.build_manifest(chunk_id, image_chunk)))
         
-        click.echo(f"  ✓ Created package manifest")
+        self._detail(f"  ✓ Created package manifest")
+    
+    def build_readme(self, chunk_id: int, image_chunk: List[Path]) -> str:
+        """Build the README.md text with instructions for team members."""
+        return self.README_TEMPLATE.substitute(
+            chunk_id_str=f"{chunk_id:03d}",
+            image_count=len(image_chunk),
+            created=self._human_ts,
+        )
     
     def create_package_readme(self, package_path: Path, chunk_id: int, image_chunk: List[Path]):
         """Create a README.md file with instructions for team members."""
-        readme_content = f"""# AI Image Analysis Work Package
-
-📦 **Package:** work-package-{chunk_id:03d}  
-🖼️ **Images to analyze:** {len(image_chunk)}  
-📅 **Created:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-
-## 🚀 Quick Start
-
-### 1. Open the AI Image Viewer
-Open the HTML file in your web browser:
-- `ai_image.html` - Unified viewer with all AI models (MobileNet, EfficientNet, MediaPipe)
-
-### 2. Load Images
-- Click **"📂 Select Folder"** and choose the `images/` folder
-- Or click **"📁 Select Images"** to load individual files
-- You should see {len(image_chunk)} images loaded
-
-### 3. Choose AI Model and Analyze
-- Select your preferred AI model from the dropdown (MobileNet, EfficientNet, or MediaPipe)
-- Click the **AI Analyze** button 🤖
-- Wait for analysis to complete (progress bar will show status)
-- All images will get AI-generated tags and descriptions
-
-### 4. Export Results
-- Click **"💾 Export Metadata"** button
-- This saves a `.json` file with all analysis results
-- The filename will be based on your selected model: `ai-image-mobilenet-metadata.json`, `ai-image-efficientnet-metadata.json`, or `ai-image-mediapipe-metadata.json`
-
-### 5. Send Back to Team Lead
-- **Compress this entire folder** (including the new metadata file):
-  ```bash
-  # Easy way: Use the included script
-  ./compress-package.sh
-  
-  # Manual way: 
-  cd ..
-  tar -czf work-package-{chunk_id:03d}-completed.tar.gz work-package-{chunk_id:03d}/
-  ```
-- **Send the compressed file** back to your team lead
-- Team lead will merge all results using the join tool
-
-## 📝 Tips
-
-- **Edit captions**: Click on any image caption to edit it manually
-- **Search**: Use the search feature to find specific images
-- **Grid layout**: Adjust how many images per row (1-6)
-- **Model comparison**: Try different models to compare accuracy
-
-## 🔍 File Structure
-
-```
-work-package-{chunk_id:03d}/
-├── README.md                              # This file
-├── compress-package.sh                    # Script to compress your completed work
-├── ai_image.html                          # Unified AI viewer (all models)
-├── docs/                                  # Documentation assets
-├── images/                                # Your {len(image_chunk)} images to analyze
-├── package-manifest.json                 # Package info
-└── [exported-metadata].json              # Your analysis results (after export)
-```
-
-## ❓ Questions?
-
-If you run into issues:
-1. Make sure you're using a modern web browser (Chrome, Firefox, Safari, Edge)
-2. Check the browser console for any error messages
-3. Try a different AI model if one isn't working
-4. Contact your team lead for help
-
-**Happy analyzing! 🚀**
-"""
-        
         readme_path = package_path / "README.md"
         with open(readme_path, 'w', encoding='utf-8') as f:
-            f.write(readme_content)
+            f.write(self.build_readme(chunk_id, image_chunk))
         
-        click.echo(f"  ✓ Created README.md for team members")
+        self._detail(f"  ✓ Created README.md for team members")
     
     def split(self) -> List[Path]:
-        """Main method to split the work."""
+        """Main method to split the work.
+        
+        Image counts of the created packages are kept in package_counts.
+        """
         click.echo(f"🔍 Analyzing source folder: {self.source_folder}")
         
+        # All packages of one run share the same "created" time
+        self._set_run_timestamp()
+        
         # Get all image files
         image_files = self.get_image_files()
         if not image_files:
@@ -246,47 +474,216 @@ If you run into issues:
         
         click.echo(f"📦 Creating {actual_splits} work packages in: {self.output_folder}")
         
-        # Create output directory
+        # Create output directory, plus every package folder in one pass
         self.output_folder.mkdir(parents=True, exist_ok=True)
+        if not self.archive_only:
+            for chunk_id in range(1, actual_splits + 1):
+                os.makedirs(self.output_folder / f"work-package-{chunk_id:03d}" / "images", exist_ok=True)
+        
+        # Decide once whether package images can be hardlinks to the sources
+        self._link_images = self.link_images
+        if self._link_images is None:
+            self._link_images = os.stat(self.source_folder).st_dev == os.stat(self.output_folder).st_dev
         
-        # Create each work package
+        # With --docs-symlink, package folders point at one shared docs/ copy
+        docs_src = self.project_root / "docs"
+        if self.docs_symlink and not self.archive_only and docs_src.exists():
+            self._shared_docs = self.output_folder / "_shared_docs"
+            clone_tree(docs_src, self._shared_docs)
+        
+        # Archives are written straight from the sources with --archive-only
+        create_package = self.create_package_archive if self.archive_only else self.create_work_package
+        
+        # Create each work package; one copy pool serves every package folder
+        # instead of starting and draining a pool per package
         created_packages = []
-        for i, chunk in enumerate(chunks):
-            click.echo(f"\n📦 Creating package {i+1}/{actual_splits}:")
-            package_path = self.create_work_package(i+1, chunk)
-            created_packages.append(package_path)
-            click.echo(f"   Package: {package_path.name} ({len(chunk)} images)")
+        self.package_counts = {}
+        if self.jobs > 1 and not self.archive_only:
+            self._copy_pool = ThreadPoolExecutor(max_workers=self.jobs)
+        try:
+            with self._progress(actual_splits, "   Packages") as bar:
+                for i, chunk in enumerate(chunks):
+                    package_path, messages = self._run_buffered(create_package, i+1, chunk)
+                    created_packages.append(package_path)
+                    self.package_counts[package_path] = len(chunk)
+                    if self.verbose:
+                        # One write per package instead of one per step
+                        click.echo("\n".join([f"\n📦 Creating package {i+1}/{actual_splits}:",
+                                              *messages,
+                                              f"   Package: {package_path.name} ({len(chunk)} images)"]))
+                    if bar is not None:
+                        bar.update(1)
+        finally:
+            if self._copy_pool is not None:
+                self._copy_pool.shutdown()
+                self._copy_pool = None
         
         return created_packages
     
+    def choose_compression(self, image_bytes: int) -> str:
+        """Archive format for one package, resolving --compression auto."""
+        if self.compression != 'auto':
+            return self.compression
+        total_bytes = image_bytes + self._shared_bytes
+        if image_bytes > self.STORE_ONLY_IMAGE_SHARE * total_bytes:
+            return 'none'
+        return 'gzip'
+    
+    @functools.cached_property
+    def _shared_bytes(self) -> int:
+        """Size of the HTML, docs and script files that every package carries."""
+        shared_files = [self.project_root / html_file for html_file in self.HTML_FILES]
+        shared_files.append(self.project_root / "collab" / "compress-packages.sh")
+        total = sum(path.stat().st_size for path in shared_files if path.is_file())
+        for dirpath, _, filenames in os.walk(self.project_root / "docs"):
+            total += sum(os.path.getsize(os.path.join(dirpath, name)) for name in filenames)
+        return total
+    
     def compress_packages(self, packages: List[Path]) -> List[Path]:
-        """Compress work packages into .tar.gz files."""
+        """Compress work packages into .tar.gz (or .tar.zst / .tar) files."""
         compressed_files = []
+        packages = [package_path for package_path in packages if package_path.exists()]
         
         click.echo(f"\n🗜️  Compressing {len(packages)} packages...")
         
-        for package_path in packages:
-            if not package_path.exists():
-                continue
-                
-            # Create .tar.gz file in the same directory
-            archive_name = f"{package_path.name}.tar.gz"
-            archive_path = package_path.parent / archive_name
-            
-            click.echo(f"   Compressing {package_path.name}...")
+        if not packages:
+            return compressed_files
+        
+        # zlib and zstd release the GIL while compressing, so threads overlap
+        # the packages without the pickling and start-up cost of processes
+        errors = []
+        with ThreadPoolExecutor(max_workers=self._max_workers(len(packages))) as executor, \
+                self._progress(len(packages), "   Archives") as bar:
+            futures = [executor.submit(self._run_buffered, self.compress_package, package_path)
+                       for package_path in packages]
             
-            try:
-                with tarfile.open(archive_path, "w:gz") as tar:
-                    tar.add(package_path, arcname=package_path.name)
-                
-                compressed_files.append(archive_path)
-                click.echo(f"   ✓ Created {archive_name}")
-                
-            except Exception as e:
-                click.echo(f"   ❌ Error compressing {package_path.name}: {e}")
-                continue
+            for future in futures:
+                archive_path, messages = future.result()
+                if bar is not None:
+                    # Only errors are buffered without --verbose; show them after the bar
+                    bar.update(1)
+                    errors.extend(messages)
+                elif messages:
+                    click.echo("\n".join(messages))
+                if archive_path is not None:
+                    compressed_files.append(archive_path)
+        
+        for message in errors:
+            click.echo(message)
         
         return compressed_files
+    
+    def compress_package(self, package_path: Path) -> Optional[Path]:
+        """Compress a single work package into an archive next to it."""
+        image_bytes = 0
+        if self.compression == 'auto':
+            with os.scandir(package_path / "images") as it:
+                image_bytes = sum(entry.stat().st_size for entry in it if entry.is_file())
+        compression = self.choose_compression(image_bytes)
+        
+        # Create the archive in the same directory
+        archive_name = f"{package_path.name}{self.ARCHIVE_FORMATS[compression][0]}"
+        archive_path = package_path.parent / archive_name
+        
+        self._detail(f"   Compressing {package_path.name}...")
+        
+        try:
+            with self._open_tar(archive_path, compression) as tar:
+                _add_tree(tar, package_path, package_path.name)
+            
+            self._detail(f"   ✓ Created {archive_name}")
+            return archive_path
+            
+        except Exception as e:
+            self._echo(f"   ❌ Error compressing {package_path.name}: {e}")
+            return None
+    
+    @contextmanager
+    def _open_tar(self, archive_path: Path, compression: str):
+        """Open a tar archive for writing in the given compression format.
+        
+        Symlinks are followed, so a --docs-symlink package still archives
+        a real docs/ folder.
+        """
+        if compression == 'zstd':
+            # Sequential "w|" stream into multithreaded zstd, no seeking needed
+            cctx = zstandard.ZstdCompressor(level=3, threads=-1)
+            with open(archive_path, 'wb') as fp, cctx.stream_writer(fp) as comp, \
+                    tarfile.open(fileobj=comp, mode="w|", dereference=True,
+                                 copybufsize=TAR_COPY_BUFSIZE) as tar:
+                yield tar
+        elif compression == 'none':
+            # Images are already compressed; a plain tar skips the deflate pass
+            with tarfile.open(archive_path, "w", dereference=True,
+                              copybufsize=TAR_COPY_BUFSIZE) as tar:
+                yield tar
+        elif PIGZ is not None:
+            # tarfile only frames the stream; pigz deflates it on all cores
+            # (-9 matches the compression level of tarfile's "w:gz")
+            pipe_error = None
+            with open(archive_path, 'wb') as fp:
+                proc = subprocess.Popen([PIGZ, '-9', '-p', str(os.cpu_count() or 1), '-c'],
+                                        stdin=subprocess.PIPE, stdout=fp)
+                try:
+                    with tarfile.open(fileobj=proc.stdin, mode="w|", dereference=True,
+                                      copybufsize=TAR_COPY_BUFSIZE) as tar:
+                        yield tar
+                except BrokenPipeError as e:
+                    # pigz went away; its exit status below says why
+                    pipe_error = e
+                finally:
+                    try:
+                        proc.stdin.close()
+                    except BrokenPipeError as e:
+                        pipe_error = pipe_error or e
+                    # Always reap pigz, even when the pipe broke
+                    returncode = proc.wait()
+            if returncode != 0:
+                raise OSError(f"pigz exited with status {returncode}") from pipe_error
+            if pipe_error is not None:
+                raise pipe_error
+        else:
+            with tarfile.open(archive_path, "w:gz", dereference=True,
+                              copybufsize=TAR_COPY_BUFSIZE) as tar:
+                yield tar
+    
+    def _set_run_timestamp(self):
+        """Capture the current time once, formatted for manifests and READMEs."""
+        self._run_timestamp = datetime.now()
+        self._iso_ts = self._run_timestamp.isoformat()
+        self._human_ts = self._run_timestamp.strftime('%Y-%m-%d %H:%M:%S')
+    
+    def _progress(self, length: int, label: str):
+        """Progress bar over package work, or a no-op context in verbose mode."""
+        if self.verbose:
+            return nullcontext()
+        return click.progressbar(length=length, label=label)
+    
+    @staticmethod
+    def _max_workers(num_tasks: int) -> int:
+        """Thread count for per-package compression."""
+        return max(1, min(num_tasks, os.cpu_count() or 1))
+    
+    def _detail(self, message: str):
+        """Echo a per-package step message, only in verbose mode."""
+        if self.verbose:
+            self._echo(message)
+    
+    def _echo(self, message: str):
+        """Echo a message, or buffer it when called from a package worker thread."""
+        messages = getattr(self._thread_state, 'messages', None)
+        if messages is None:
+            click.echo(message)
+        else:
+            messages.append(message)
+    
+    def _run_buffered(self, func, *args):
+        """Run func in a worker thread and return (result, echoed messages)."""
+        messages = self._thread_state.messages = []
+        try:
+            return func(*args), messages
+        finally:
+            self._thread_state.messages = None
 
 
 @click.command()
@@ -306,8 +703,42 @@ If you run into issues:
               is_flag=True,
               default=True,
               help='Automatically compress each package as .tar.gz')
+@click.option('--zstd', '-z',
+              is_flag=True,
+              default=False,
+              help='Same as --compression zstd')
+@click.option('--compression',
+              type=click.Choice(['gzip', 'zstd', 'none', 'auto']),
+              default='gzip',
+              show_default=True,
+              help='Archive compression: gzip (.tar.gz), multithreaded zstd (.tar.zst, '
+                   'requires zstandard), none (store-only .tar) or auto (store-only '
+                   'when images are over 80% of a package, else gzip)')
+@click.option('--verbose', '-v',
+              is_flag=True,
+              default=False,
+              help='Print every per-package step instead of progress bars')
+@click.option('--link-images/--copy-images',
+              default=None,
+              help='Hardlink images into package folders instead of copying them '
+                   '(default: link when source and output share a filesystem)')
+@click.option('--docs-symlink',
+              is_flag=True,
+              default=False,
+              help='Write docs/ once to _shared_docs and symlink it from each package folder')
+@click.option('--archive-only', '-a',
+              is_flag=True,
+              default=False,
+              help='Write packages straight into archives without package folders')
+@click.option('--jobs', '-j',
+              type=click.IntRange(min=1),
+              default=DEFAULT_JOBS,
+              show_default=True,
+              help='Number of parallel image copies per package')
 @click.version_option(version='1.0.0', prog_name='AI Image Viewer Work Splitter')
-def main(source: Path, num_splits: int, output: Path, compress: bool):
+def main(source: Path, num_splits: int, output: Path, compress: bool, zstd: bool, compression: str,
+         verbose: bool, link_images: Optional[bool], docs_symlink: bool, archive_only: bool,
+         jobs: int):
     """
     🧠 AI Image Viewer - Work Splitter Tool
     
@@ -323,6 +754,14 @@ def main(source: Path, num_splits: int, output: Path, compress: bool):
     \b
     # Split with custom output location
     python split_work.py -s /path/to/images -n 3 -o /path/to/packages
+    
+    \b
+    # Ship .tar.zst archives instead of .tar.gz
+    python split_work.py -s ./big-dataset -n 5 -z
+    
+    \b
+    # Only write the archives, skipping the package folders
+    python split_work.py -s ./big-dataset -n 5 -a
     """
     
     if num_splits < 1:
@@ -331,6 +770,12 @@ def main(source: Path, num_splits: int, output: Path, compress: bool):
     if num_splits > 100:
         raise click.BadParameter("Number of splits cannot exceed 100 (too many packages)")
     
+    if zstd:
+        compression = 'zstd'
+    
+    if compression == 'zstd' and not ZSTANDARD_AVAILABLE:
+        raise click.BadParameter("zstd compression requires the zstandard package (pip install zstandard)")
+    
     # Set default output location
     if output is None:
         output = Path(__file__).parent / "split"
@@ -340,14 +785,18 @@ def main(source: Path, num_splits: int, output: Path, compress: bool):
         click.echo("=" * 45)
         
         # Initialize splitter
-        splitter = WorkSplitter(source, output, num_splits)
+        splitter = WorkSplitter(source, output, num_splits, jobs=jobs, compression=compression,
+                                verbose=verbose, archive_only=archive_only,
+                                link_images=link_images, docs_symlink=docs_symlink)
         
         # Perform the split
         packages = splitter.split()
         
         # Compress packages if requested
         compressed_files = []
-        if compress:
+        if archive_only:
+            compressed_files = packages
+        elif compress:
             compressed_files = splitter.compress_packages(packages)
         
         click.echo(f"\n✅ Successfully created {len(packages)} work packages!")
@@ -357,18 +806,18 @@ def main(source: Path, num_splits: int, output: Path, compress: bool):
         
         # Show summary
         click.echo(f"\n📋 Package Summary:")
-        for i, package in enumerate(packages):
-            manifest_path = package / "package-manifest.json"
-            if manifest_path.exists():
-                with open(manifest_path, 'r') as f:
-                    manifest = json.load(f)
-                image_count = manifest['package_info']['image_count']
-                click.echo(f"   {package.name}: {image_count} images")
+        for package, image_count in splitter.package_counts.items():
+            click.echo(f"   {package.name}: {image_count} images")
         
         click.echo(f"\n🚀 Next Steps:")
-        if compress:
-            click.echo(f"1. Share .tar.gz files with team members")
-            click.echo(f"2. Team members extract: tar -xzf work-package-001.tar.gz")
+        if compress or archive_only:
+            if compression == 'auto':
+                click.echo(f"1. Share .tar.gz / .tar files with team members")
+                click.echo(f"2. Team members extract: tar -xf work-package-001.tar.gz (or .tar)")
+            else:
+                suffix, extract_command = WorkSplitter.ARCHIVE_FORMATS[compression]
+                click.echo(f"1. Share {suffix} files with team members")
+                click.echo(f"2. Team members extract: {extract_command} work-package-001{suffix}")
             click.echo(f"3. Team members analyze their assigned images and send back the bundle to team lead")
             click.echo(f"4. Team lead uses join_work.py to merge results after all work packages are received")
         else: